@@ -0,0 +1,120 @@
+"""Probabilistic backtest — Brier score, log loss and calibration of the pricing models.
+
+Replays the completed matches once (elo_engine.replay). The binary models
+run through elo_engine's BacktestObserver and CalibrationObserver with
+their own forecast function. Every forecast is scored into fixed-size
+accumulators (ForecastScore), so memory stays constant however long the
+match history gets.
+
+Forecasts scored on decisive matches where both players have
+BACKTEST_MIN_GAMES games (elo_engine.pre_match_probability):
+    elo:         expected_score for player 1
+    knockout:    knockout_probability for player 1, higher Elo as higher
+                 seed, QF stage — what a knockout market would have quoted
+    exact_score: the exact-score prop distribution (6 outcomes), on
+                 first-to-3 results
+
+Reference points: always quoting 50% scores Brier 0.25 and log loss 0.693;
+a uniform exact-score forecast scores log loss 1.792.
+
+Reports are cached per match-table version (match_table_version).
+"""
+
+from elo_engine import (
+    BacktestObserver,
+    CalibrationObserver,
+    ForecastScore,
+    ReplayObserver,
+    pre_match_probability,
+    replay,
+)
+from match_data import completed_matches, match_table_version
+from odds_engine import knockout_probability
+from prop_odds_calculator import exact_score_market
+
+
+def knockout_forecast(elo1: float, elo2: float) -> float:
+    """Knockout-market probability for player 1, the higher Elo as higher seed."""
+    return knockout_probability(elo1, elo2, a_is_higher_seed=elo1 >= elo2)
+
+
+def _exact_score_outcome(m: dict) -> int | None:
+    """Index into exact_score_market's selections (P1 3-0/3-1/3-2, P2 3-0/3-1/3-2)."""
+    p1_won = m["winner"] == m["player1"]
+    won, lost = (m["score1"], m["score2"]) if p1_won else (m["score2"], m["score1"])
+    if won != 3 or lost not in (0, 1, 2):
+        return None
+    return lost if p1_won else 3 + lost
+
+
+class ExactScoreObserver(ReplayObserver):
+    """Scores the exact-score prop distribution on scored first-to-3 results."""
+
+    def __init__(self):
+        self.score = ForecastScore()
+
+    def before_match(self, m: dict, ratings: dict):
+        if pre_match_probability(m, ratings) is None:
+            return
+        outcome = _exact_score_outcome(m)
+        if outcome is None:
+            return
+        market = exact_score_market(
+            ratings[m["player1"]].elo, ratings[m["player2"]].elo, m["player1"], m["player2"]
+        )
+        self.score.add([s["true_probability"] for s in market["selections"]], outcome)
+
+
+def run_probabilistic_backtest(matches: list[dict]) -> dict:
+    """Score every model's pre-match forecasts over one replay of matches."""
+    binary = {
+        "elo": (BacktestObserver(), CalibrationObserver()),
+        "knockout": (
+            BacktestObserver(knockout_forecast),
+            CalibrationObserver(forecast=knockout_forecast),
+        ),
+    }
+    exact_score = ExactScoreObserver()
+    replay(matches, [*(o for pair in binary.values() for o in pair), exact_score])
+
+    report = {"completed_matches": len(matches)}
+    for model, (backtest, calibration) in binary.items():
+        report[model] = {**backtest.score.result(), "calibration": calibration.result()}
+    report["exact_score"] = exact_score.score.result()
+    return report
+
+
+_report_cache: tuple[int, dict] | None = None  # (match_table_version, report)
+
+
+def get_backtest_report() -> dict:
+    """Backtest report for the current match table, recomputed only when it changes."""
+    global _report_cache
+    version = match_table_version()
+    if _report_cache is not None and _report_cache[0] == version:
+        return _report_cache[1]
+
+    report = {"data_version": version, **run_probabilistic_backtest(completed_matches())}
+    _report_cache = (version, report)
+    return report
+
+
+if __name__ == "__main__":
+    from database import create_tables
+
+    create_tables()
+    report = get_backtest_report()
+    print(f"Probabilistic backtest over {report['completed_matches']} completed matches\n")
+    for model in ("elo", "knockout", "exact_score"):
+        r = report[model]
+        print(
+            f"  {model:<12} n={r['n']:<4} brier={r['brier']:.4f} "
+            f"log_loss={r['log_loss']:.4f} accuracy={r['accuracy']:.1%}"
+        )
+    print("\n  Elo calibration:")
+    for b in report["elo"]["calibration"]:
+        print(
+            f"    {b['low']:.1f}-{b['high']:.1f}: n={b['count']:<4} "
+            f"predicted={b['predicted']:.3f} observed={b['observed']:.3f}"
+        )
+    assert get_backtest_report() is report, "report not served from cache"
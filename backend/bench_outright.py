@@ -0,0 +1,160 @@
+"""Benchmark for the outright Monte Carlo engine.
+
+Runs the vectorized simulation on the real tournament_database.csv schedule
+(no database needed) with 1/2/4/8 worker processes, reports wall time and
+speedup, and checks that every worker count returns bit-identical counts.
+
+With --variance-reduction it instead measures how much each variance-
+reduction option (antithetic, common random numbers, stratified margins)
+cuts the variance of the title probabilities against plain sampling at the
+same iteration count, over independent replications. Common random numbers
+are measured on the odds movement after the next scheduled result.
+
+With --qmc it compares the error of plain Monte Carlo and scrambled-Sobol
+quasi-Monte Carlo (needs scipy) against the iteration count. The error is
+the RMS over players of the spread of title probabilities across
+independent replications.
+
+Usage:
+    python bench_outright.py
+    python bench_outright.py --iterations 1000000 --workers 1 2 4 8 --chunk-size 65536
+    python bench_outright.py --variance-reduction --iterations 16384 --replications 30
+    python bench_outright.py --qmc --replications 20
+"""
+
+import argparse
+import os
+import time
+
+import monte_carlo
+import numpy as np
+from elo_engine import process_matches
+from match_data import get_completed_matches, get_scheduled_matches, parse_tournament_csv
+from odds_engine import RANDOM_SEED, build_simulation_context
+
+
+def csv_context(matches: list[dict] | None = None):
+    """Build a SimulationContext straight from the tournament CSV."""
+    if matches is None:
+        matches = parse_tournament_csv()
+    completed = get_completed_matches(matches)
+    sched = get_scheduled_matches(matches)
+    return build_simulation_context(process_matches(completed), sched, completed)
+
+
+def csv_context_after_next_result():
+    """SimulationContext after the next scheduled match ends 3-1 to player 1."""
+    matches = parse_tournament_csv()
+    nxt = get_scheduled_matches(matches)[0]
+    nxt.update(score1=3, score2=1, status="Completed", winner=nxt["player1"])
+    return csv_context(matches)
+
+
+def bench_workers(ctx, iterations: int, workers_list: list[int], chunk_size: int | None):
+    """Time simulate_outright per worker count and verify identical results."""
+    print(f"\nIterations: {iterations:,}  (seed block: {monte_carlo.SEED_BLOCK:,})")
+    print(f"CPU cores available: {os.cpu_count()}")
+    print(f"{'Workers':>7} {'Time (s)':>9} {'Iter/s':>12} {'Speedup':>8} {'Identical':>10}")
+    print("-" * 52)
+
+    baseline_time = None
+    baseline = None
+    for workers in workers_list:
+        start = time.perf_counter()
+        sim = monte_carlo.simulate_outright(
+            ctx, iterations, RANDOM_SEED, workers=workers, chunk_size=chunk_size
+        )
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline_time = elapsed
+            baseline = sim
+        identical = np.array_equal(sim.win_counts, baseline.win_counts) and np.array_equal(
+            sim.top8_counts, baseline.top8_counts
+        )
+        print(
+            f"{workers:>7} {elapsed:>9.2f} {iterations / elapsed:>12,.0f} "
+            f"{baseline_time / elapsed:>7.2f}x {'yes' if identical else 'NO':>10}"
+        )
+
+
+def bench_variance_reduction(ctx, iterations: int, replications: int):
+    """Report the variance reduction of each option against plain sampling."""
+    ctx_after = csv_context_after_next_result()
+    options = [
+        (monte_carlo.VarianceReduction(antithetic=True), None),
+        (monte_carlo.VarianceReduction(stratified_margins=True), None),
+        (monte_carlo.VarianceReduction(antithetic=True, stratified_margins=True), None),
+        (monte_carlo.VarianceReduction(common_random_numbers=True), ctx_after),
+        (
+            monte_carlo.VarianceReduction(
+                antithetic=True, common_random_numbers=True, stratified_margins=True
+            ),
+            ctx_after,
+        ),
+    ]
+
+    print(f"\nIterations: {iterations:,}  Replications: {replications}")
+    print(f"{'Option':<28} {'Measured on':<18} {'Var. reduction':>15}")
+    print("-" * 63)
+    for variance, after in options:
+        start = time.perf_counter()
+        factor = monte_carlo.measure_variance_reduction(
+            ctx, variance, iterations, replications, RANDOM_SEED, ctx_after=after
+        )
+        target = "odds movement" if after is not None else "title probability"
+        print(
+            f"{variance.label:<28} {target:<18} {factor:>14.2f}x"
+            f"  ({time.perf_counter() - start:.1f}s)"
+        )
+
+
+def replication_error(ctx, variance, iterations: int, replications: int) -> float:
+    """RMS standard deviation of title probabilities across independent runs."""
+    runs = np.array(
+        [
+            monte_carlo.simulate_outright(
+                ctx, iterations, RANDOM_SEED + r, variance=variance
+            ).win_prob
+            for r in range(replications)
+        ]
+    )
+    return float(np.sqrt(runs.var(axis=0, ddof=1).mean()))
+
+
+def bench_qmc(ctx, iteration_counts: list[int], replications: int):
+    """Error vs iteration count for plain MC and scrambled Sobol QMC."""
+    qmc = monte_carlo.VarianceReduction(quasi_monte_carlo=True)
+    print(f"\nReplications: {replications}  (Sobol replicate: {monte_carlo.QMC_REPLICATE:,})")
+    print(f"{'Iterations':>10} {'MC error':>10} {'QMC error':>10} {'Var. ratio':>11}")
+    print("-" * 45)
+    for iterations in iteration_counts:
+        mc_error = replication_error(ctx, monte_carlo.PLAIN, iterations, replications)
+        qmc_error = replication_error(ctx, qmc, iterations, replications)
+        print(
+            f"{iterations:>10,} {mc_error:>10.2e} {qmc_error:>10.2e} "
+            f"{(mc_error / qmc_error) ** 2:>10.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=400_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--variance-reduction", action="store_true")
+    parser.add_argument("--qmc", action="store_true")
+    parser.add_argument(
+        "--qmc-iterations", type=int, nargs="+", default=[2048, 8192, 32768, 131072]
+    )
+    parser.add_argument("--replications", type=int, default=30)
+    args = parser.parse_args()
+
+    print("Fantasy Darts Outright Benchmark")
+    print("=" * 52)
+    if args.variance_reduction:
+        bench_variance_reduction(csv_context(), args.iterations, args.replications)
+    elif args.qmc:
+        bench_qmc(csv_context(), args.qmc_iterations, args.replications)
+    else:
+        bench_workers(csv_context(), args.iterations, args.workers, args.chunk_size)
@@ -0,0 +1,124 @@
+"""Two-process check that the match_data cache stays coherent across processes.
+
+Each uvicorn worker (and the odds snapshot worker) keeps its own copy of
+the match cache. This runs two processes against one database:
+    1. both warm their caches
+    2. the peer process enters a result; this process must see it
+    3. this process enters a result; the peer must see it
+and then times a cached read (one version check) against a full reload.
+
+By default it uses a scratch SQLite file seeded from the tournament CSV.
+--db points it at another database, e.g. an empty Postgres. That database
+gets two results written to it, so never use one that matters.
+
+Usage:
+    python check_cache_coherence.py
+    python check_cache_coherence.py --db postgresql://localhost/darts_scratch
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+
+def _snapshot() -> dict:
+    from match_data import completed_matches, match_table_version, scheduled_matches
+
+    return {
+        "version": match_table_version(),
+        "completed": {m["match_id"] for m in completed_matches()},
+        "scheduled": [(m["match_id"], m["player1"]) for m in scheduled_matches()],
+    }
+
+
+def _peer(conn):
+    """Second process: serves read/write commands until told to stop."""
+    from match_data import write_match_result
+
+    while (command := conn.recv()) is not None:
+        if command[0] == "write":
+            write_match_result(command[1], 3, 1, command[2])
+            conn.send(None)
+        else:
+            conn.send(_snapshot())
+
+
+def _enter_next_result(state: dict, via=None) -> int:
+    """Enter a 3-1 win for player 1 in the first scheduled match, here or via the peer."""
+    from match_data import write_match_result
+
+    match_id, winner = state["scheduled"][0]
+    if via is None:
+        write_match_result(match_id, 3, 1, winner)
+    else:
+        via.send(("write", match_id, winner))
+        via.recv()
+    return match_id
+
+
+def _expect(state: dict, before: dict, match_id: int, who: str):
+    assert state["version"] == before["version"] + 1, f"{who}: version did not move"
+    assert match_id in state["completed"], f"{who}: result for match {match_id} not seen"
+    assert match_id not in [m for m, _ in state["scheduled"]], f"{who}: match still scheduled"
+    print(f"  {who} sees match {match_id} (version {before['version']} -> {state['version']})")
+
+
+def check_coherence():
+    from database import create_tables
+    from match_data import completed_matches, invalidate_cache, seed_matches_from_csv
+
+    create_tables()
+    seed_matches_from_csv()
+
+    conn, peer_conn = mp.get_context("spawn").Pipe()
+    peer = mp.get_context("spawn").Process(target=_peer, args=(peer_conn,))
+    peer.start()
+    try:
+        mine = _snapshot()
+        conn.send(("read",))
+        theirs = conn.recv()
+        assert mine == theirs, "processes disagree before any write"
+        print(f"  both warm: version {mine['version']}, {len(mine['completed'])} completed")
+
+        match_id = _enter_next_result(mine, via=conn)
+        _expect(_snapshot(), mine, match_id, "this process")
+
+        before = _snapshot()
+        conn.send(("read",))
+        _expect(conn.recv(), mine, match_id, "peer")
+        match_id = _enter_next_result(before)
+        conn.send(("read",))
+        _expect(conn.recv(), before, match_id, "peer")
+    finally:
+        conn.send(None)
+        peer.join()
+
+    reads = 200
+    start = time.perf_counter()
+    for _ in range(reads):
+        completed_matches()
+    cached = (time.perf_counter() - start) / reads
+    start = time.perf_counter()
+    for _ in range(reads // 10):
+        invalidate_cache()
+        completed_matches()
+    reload = (time.perf_counter() - start) / (reads // 10)
+    print(f"\n  cached read: {cached * 1e3:.3f} ms   full reload: {reload * 1e3:.3f} ms")
+    print("\nPASS: writes from either process are seen by the other on the next read")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help="Database URL (default: a scratch SQLite file)")
+    args = parser.parse_args()
+
+    # Before database is first imported; the peer process inherits it
+    os.environ["DATABASE_URL"] = args.db or (
+        "sqlite:///" + os.path.join(tempfile.mkdtemp(), "coherence.db")
+    )
+    print("Fantasy Darts Match Cache Coherence Check")
+    print("=" * 52)
+    print(f"  database: {os.environ['DATABASE_URL']}")
+    check_coherence()
@@ -187,6 +187,57 @@ class Match(Base):
     p2_ton_checkout = Column(Boolean, default=False)
 
 
+class RatingState(Base):
+    """Persisted Elo state per player — advanced by each entered result."""
+
+    __tablename__ = "rating_state"
+
+    id = Column(Integer, primary_key=True, index=True)
+    player = Column(String(100), unique=True, index=True, nullable=False)
+    elo = Column(Float, nullable=False)
+    games_played = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    draws = Column(Integer, default=0)
+    last_match_id = Column(Integer, nullable=True)  # Latest match applied for this player
+
+
+class RatingCheckpoint(Base):
+    """Elo state per player after the first `seq` completed matches (point-in-time reads)."""
+
+    __tablename__ = "rating_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    seq = Column(Integer, index=True, nullable=False)  # Completed matches applied
+    through_match_id = Column(Integer, index=True, nullable=False)  # Last match applied
+    player = Column(String(100), nullable=False)
+    elo = Column(Float, nullable=False)
+    games_played = Column(Integer, default=0)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    draws = Column(Integer, default=0)
+    last_match_id = Column(Integer, nullable=True)
+
+
+class DataVersion(Base):
+    """Monotonic version counter per data set, bumped in the writing transaction."""
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)  # e.g. "matches"
+    version = Column(Integer, nullable=False, default=0)
+
+
+class StreamedSimulation(Base):
+    """A streamed simulation in flight; shared so any worker process can cancel it."""
+
+    __tablename__ = "simulation_runs"
+
+    run_id = Column(String(32), primary_key=True)
+    cancelled = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class Activity(Base):
     """Activity feed for live updates."""
 
@@ -0,0 +1,46 @@
+"""Shape-preserving downsampling for chart series (Largest-Triangle-Three-Buckets).
+
+LTTB always keeps the first and last point and splits the rest into
+equal-width buckets. From each bucket it keeps the point that forms the
+largest triangle with the point kept from the previous bucket and the mean
+of the next bucket. Peaks, troughs and turning points survive, which is
+what a rating trajectory needs, where averaging or striding would flatten
+them.
+"""
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points LTTB keeps, at most threshold of them.
+
+    Args:
+        x: (n,) increasing x values (e.g. match_id)
+        y: (n,) values at x
+        threshold: point budget; series with n <= threshold (or a budget
+            below 3) are returned whole
+
+    Returns:
+        (k,) increasing indices into x/y, always including 0 and n - 1.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= threshold or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = a = 0
+    keep[-1] = n - 1
+    for b in range(threshold - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_lo, next_hi = (hi, edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        cx = x[next_lo:next_hi].mean()
+        cy = y[next_lo:next_hi].mean()
+        # Twice the triangle area (a, candidate, next-bucket mean), per candidate
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    return keep
@@ -11,12 +11,15 @@ Reference: docs/ELO_K_FACTOR_RESEARCH.md
 """
 
 import math
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
 from match_data import (
     ALL_PLAYERS,
     completed_matches,
     get_standings,
+    query_completed_matches,
 )
 
 # --- Constants ---
@@ -49,7 +52,42 @@ MOV_MULTIPLIERS: dict[tuple[int, int], float] = {
 MOV_DEFAULT = 1.0  # For unusual scores like 2-1
 
 
-@dataclass
+class RatingHistory:
+    """Columnar (match_id, elo) history shared by every player in a replay.
+
+    Each player's entries are appended, in match order, to that player's own
+    pair of typed arrays rather than a list of tuples, so a replay allocates
+    no per-entry objects and a player's series is one contiguous block
+    (read back with a single copy, not a per-entry loop).
+    """
+
+    __slots__ = ("_match_ids", "_elos")
+
+    def __init__(self):
+        self._match_ids: dict[str, array] = {}
+        self._elos: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return sum(len(elos) for elos in self._elos.values())
+
+    def record(self, player: str, match_id: int, elo: float):
+        elos = self._elos.get(player)
+        if elos is None:
+            elos = self._elos[player] = array("d")
+            self._match_ids[player] = array("q")
+        self._match_ids[player].append(match_id)
+        elos.append(elo)
+
+    def player_match_ids(self, player: str) -> array:
+        """A player's match ids, in match order (a copy)."""
+        return self._match_ids.get(player, array("q"))[:]
+
+    def player_elos(self, player: str) -> array:
+        """A player's Elo after each of those matches (a copy)."""
+        return self._elos.get(player, array("d"))[:]
+
+
+@dataclass(slots=True)
 class PlayerRating:
     name: str
     elo: float = INITIAL_ELO
@@ -57,11 +95,20 @@ class PlayerRating:
     wins: int = 0
     losses: int = 0
     draws: int = 0
-    elo_history: list[tuple[int, float]] = field(default_factory=list)
+    last_match_id: int | None = None  # Latest match applied
+    history: RatingHistory | None = None  # Shared store, set by HistoryObserver
 
     def record_snapshot(self, match_id: int):
-        """Record current Elo after a match."""
-        self.elo_history.append((match_id, self.elo))
+        """Mark a match as applied (history is captured by HistoryObserver)."""
+        self.last_match_id = match_id
+
+    @property
+    def elo_history(self) -> list[tuple[int, float]]:
+        """(match_id, elo) after each of this player's matches."""
+        if self.history is None:
+            return []
+        store = self.history
+        return list(zip(store.player_match_ids(self.name), store.player_elos(self.name)))
 
 
 def games_played_decay(n: int) -> float:
@@ -145,50 +192,547 @@ def update_elo(
     loser.record_snapshot(match_id)
 
 
-def process_matches(matches: list[dict]) -> dict[str, PlayerRating]:
+def apply_match(ratings: dict[str, PlayerRating], m: dict):
+    """Advance ratings by one completed match (draws count as games, no Elo change)."""
+    if m["is_draw"]:
+        # No Elo change for draws, but record the game
+        p1 = ratings[m["player1"]]
+        p2 = ratings[m["player2"]]
+        p1.games_played += 1
+        p1.draws += 1
+        p2.games_played += 1
+        p2.draws += 1
+        p1.record_snapshot(m["match_id"])
+        p2.record_snapshot(m["match_id"])
+        return
+
+    if m["winner"] is None:
+        return  # Skip if no winner determined
+
+    winner_name = m["winner"]
+    loser_name = m["player2"] if m["player1"] == winner_name else m["player1"]
+
+    winner_score = m["score1"] if m["player1"] == winner_name else m["score2"]
+    loser_score = m["score2"] if m["player1"] == winner_name else m["score1"]
+
+    update_elo(
+        ratings[winner_name],
+        ratings[loser_name],
+        winner_score,
+        loser_score,
+        m["round"],
+        m["match_id"],
+    )
+
+
+def initial_ratings() -> dict[str, PlayerRating]:
+    """Every player at INITIAL_ELO with an empty record."""
+    return {name: PlayerRating(name=name) for name in ALL_PLAYERS}
+
+
+# --- Replay engine ---
+#
+# replay() walks completed matches once; observers see the ratings before
+# and after every update, so ratings and any number of diagnostics come
+# from a single traversal.
+
+BACKTEST_MIN_GAMES = 2  # Both players need this many games before we score a prediction
+UPSET_THRESHOLD = 0.35  # Winner's pre-match win probability below this is an upset
+CALIBRATION_BINS = 10
+LOG_LOSS_EPS = 1e-15  # Probability floor for log loss
+
+# Pre-match P(player 1 wins) from the two Elo ratings; expected_score by default
+Forecast = Callable[[float, float], float]
+
+
+class ReplayObserver:
+    """Base class for replay() hooks; override the ones you need."""
+
+    def start(self, ratings: dict[str, PlayerRating]):
+        """Called once with the initial ratings."""
+
+    def before_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        """Called with the ratings before m is applied."""
+
+    def after_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        """Called with the ratings after m is applied."""
+
+
+def replay(
+    matches: list[dict],
+    observers: Sequence[ReplayObserver] = (),
+    ratings: dict[str, PlayerRating] | None = None,
+) -> dict[str, PlayerRating]:
+    """Apply matches (sorted by match_id) in one pass, notifying observers.
+
+    Starts from initial ratings unless given ratings to continue from.
+    """
+    if ratings is None:
+        ratings = initial_ratings()
+    for observer in observers:
+        observer.start(ratings)
+    for m in matches:
+        for observer in observers:
+            observer.before_match(m, ratings)
+        apply_match(ratings, m)
+        for observer in observers:
+            observer.after_match(m, ratings)
+    return ratings
+
+
+def _decisive(m: dict) -> bool:
+    return not m["is_draw"] and m["winner"] is not None
+
+
+def pre_match_probability(
+    m: dict, ratings: dict[str, PlayerRating], forecast: Forecast = expected_score
+) -> float | None:
+    """Player 1's forecast win probability before m, or None if not scored.
+
+    Only decisive matches where both players have BACKTEST_MIN_GAMES games
+    are scored (no draws, no warm-up).
+    """
+    p1 = ratings[m["player1"]]
+    p2 = ratings[m["player2"]]
+    if not _decisive(m) or min(p1.games_played, p2.games_played) < BACKTEST_MIN_GAMES:
+        return None
+    return forecast(p1.elo, p2.elo)
+
+
+class ForecastScore:
+    """Running Brier score, log loss and top-pick accuracy of a forecast (O(1) memory)."""
+
+    def __init__(self):
+        self.n = 0
+        self.brier = 0.0
+        self.log_loss = 0.0
+        self.correct = 0
+
+    def add(self, probs: Sequence[float], outcome: int):
+        """Score a distribution over outcomes against the index that happened."""
+        self.n += 1
+        self.brier += sum((p - (k == outcome)) ** 2 for k, p in enumerate(probs))
+        self.log_loss -= math.log(max(probs[outcome], LOG_LOSS_EPS))
+        self.correct += max(range(len(probs)), key=probs.__getitem__) == outcome
+
+    def add_binary(self, prob: float, outcome: int):
+        """Score prob = P(outcome == 1) against outcome, with the one-sided binary Brier."""
+        self.n += 1
+        self.brier += (prob - outcome) ** 2
+        self.log_loss -= math.log(max(prob if outcome else 1.0 - prob, LOG_LOSS_EPS))
+        self.correct += (prob >= 0.5) == bool(outcome)
+
+    def result(self) -> dict:
+        """{n, brier, log_loss, accuracy}, each metric a mean over scored forecasts."""
+        n = max(self.n, 1)
+        return {
+            "n": self.n,
+            "brier": self.brier / n,
+            "log_loss": self.log_loss / n,
+            "accuracy": self.correct / n,
+        }
+
+
+class HistoryObserver(ReplayObserver):
+    """Captures (match_id, elo) after every match into one shared RatingHistory."""
+
+    def __init__(self):
+        self.history = RatingHistory()
+
+    def start(self, ratings: dict[str, PlayerRating]):
+        for rating in ratings.values():
+            rating.history = self.history
+
+    def after_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        for name in (m["player1"], m["player2"]):
+            rating = ratings[name]
+            if rating.last_match_id == m["match_id"]:
+                self.history.record(name, m["match_id"], rating.elo)
+
+
+class BacktestObserver(ReplayObserver):
+    """Prediction accuracy, Brier score and log loss of the pre-match forecast.
+
+    A prediction is correct when the player given >= 50% (by default the
+    higher-Elo player) won.
+    """
+
+    def __init__(self, forecast: Forecast = expected_score):
+        self.forecast = forecast
+        self.score = ForecastScore()
+
+    def before_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        prob = pre_match_probability(m, ratings, self.forecast)
+        if prob is not None:
+            self.score.add_binary(prob, int(m["winner"] == m["player1"]))
+
+    def result(self) -> dict:
+        score = self.score.result()
+        return {
+            "correct": self.score.correct,
+            "total": self.score.n,
+            "accuracy": score["accuracy"],
+            "accuracy_pct": round(score["accuracy"] * 100, 1),
+            "wrong_count": self.score.n - self.score.correct,
+            "brier": score["brier"],
+            "log_loss": score["log_loss"],
+        }
+
+
+class CalibrationObserver(ReplayObserver):
+    """Predicted vs observed win rate, binned by pre-match forecast probability.
+
+    Each scored match is counted once, from player 1's side.
+    """
+
+    def __init__(self, bins: int = CALIBRATION_BINS, forecast: Forecast = expected_score):
+        self.bins = bins
+        self.forecast = forecast
+        self.count = [0] * bins
+        self.predicted_sum = [0.0] * bins
+        self.wins = [0] * bins
+
+    def before_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        prob = pre_match_probability(m, ratings, self.forecast)
+        if prob is None:
+            return
+        b = min(int(prob * self.bins), self.bins - 1)
+        self.count[b] += 1
+        self.predicted_sum[b] += prob
+        self.wins[b] += m["winner"] == m["player1"]
+
+    def result(self) -> list[dict]:
+        """One entry per non-empty bin: {low, high, count, predicted, observed}."""
+        return [
+            {
+                "low": b / self.bins,
+                "high": (b + 1) / self.bins,
+                "count": self.count[b],
+                "predicted": round(self.predicted_sum[b] / self.count[b], 4),
+                "observed": round(self.wins[b] / self.count[b], 4),
+            }
+            for b in range(self.bins)
+            if self.count[b]
+        ]
+
+
+class UpsetObserver(ReplayObserver):
+    """Logs matches won by the player the ratings gave < threshold to win."""
+
+    def __init__(self, threshold: float = UPSET_THRESHOLD):
+        self.threshold = threshold
+        self.upsets: list[dict] = []
+
+    def before_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        prob = pre_match_probability(m, ratings)
+        if prob is None:
+            return
+        winner_prob = prob if m["winner"] == m["player1"] else 1.0 - prob
+        if winner_prob < self.threshold:
+            loser = m["player2"] if m["winner"] == m["player1"] else m["player1"]
+            self.upsets.append(
+                {
+                    "match_id": m["match_id"],
+                    "round": m["round"],
+                    "winner": m["winner"],
+                    "loser": loser,
+                    "score": f"{m['score1']}-{m['score2']}",
+                    "winner_prob": round(winner_prob, 4),
+                    "winner_elo": round(ratings[m["winner"]].elo, 1),
+                    "loser_elo": round(ratings[loser].elo, 1),
+                }
+            )
+
+
+def process_matches(matches: list[dict], history: bool = True) -> dict[str, PlayerRating]:
     """Process a list of completed matches and return final ratings.
 
-    Matches must be sorted by match_id (chronological order).
+    Matches must be sorted by match_id (chronological order). With
+    history=False no per-match history is recorded (state-only replays).
     """
-    ratings: dict[str, PlayerRating] = {name: PlayerRating(name=name) for name in ALL_PLAYERS}
+    return replay(matches, [HistoryObserver()] if history else [])
 
-    for m in matches:
-        if m["is_draw"]:
-            # No Elo change for draws, but record the game
-            p1 = ratings[m["player1"]]
-            p2 = ratings[m["player2"]]
-            p1.games_played += 1
-            p1.draws += 1
-            p2.games_played += 1
-            p2.draws += 1
-            p1.record_snapshot(m["match_id"])
-            p2.record_snapshot(m["match_id"])
-            continue
-
-        if m["winner"] is None:
-            continue  # Skip if no winner determined
-
-        winner_name = m["winner"]
-        loser_name = m["player2"] if m["player1"] == winner_name else m["player1"]
-
-        winner_score = m["score1"] if m["player1"] == winner_name else m["score2"]
-        loser_score = m["score2"] if m["player1"] == winner_name else m["score1"]
-
-        update_elo(
-            ratings[winner_name],
-            ratings[loser_name],
-            winner_score,
-            loser_score,
-            m["round"],
-            m["match_id"],
-        )
 
+def run_diagnostics(matches: list[dict] | None = None) -> dict:
+    """Ratings, history, backtest, calibration and upsets from one replay.
+
+    Returns:
+        dict with ratings (with elo_history), backtest, calibration, upsets
+    """
+    if matches is None:
+        matches = completed_matches()
+    backtest = BacktestObserver()
+    calibration = CalibrationObserver()
+    upsets = UpsetObserver()
+    ratings = replay(matches, [HistoryObserver(), backtest, calibration, upsets])
+    return {
+        "ratings": ratings,
+        "backtest": backtest.result(),
+        "calibration": calibration.result(),
+        "upsets": upsets.upsets,
+    }
+
+
+# --- Persisted rating state ---
+#
+# The rating_state table holds one row per player (elo, record, last match
+# applied). write_match_result advances it by the new result only. Every
+# CHECKPOINT_EVERY completed matches (in match_id order) the full state is
+# also written to rating_checkpoints, so point-in-time reads and out-of-order
+# results replay only from the nearest checkpoint instead of match 1. Elo
+# updates depend on order, so a result that lands before already-applied
+# matches invalidates the checkpoints after it.
+
+CHECKPOINT_EVERY = 25  # Completed matches between rating checkpoints
+
+
+def _row_to_rating(row) -> PlayerRating:
+    """PlayerRating from a rating_state/rating_checkpoints row (no history)."""
+    return PlayerRating(
+        name=row.player,
+        elo=row.elo,
+        games_played=row.games_played,
+        wins=row.wins,
+        losses=row.losses,
+        draws=row.draws,
+        last_match_id=row.last_match_id,
+    )
+
+
+def _store_rating(row, rating: PlayerRating):
+    row.elo = rating.elo
+    row.games_played = rating.games_played
+    row.wins = rating.wins
+    row.losses = rating.losses
+    row.draws = rating.draws
+    row.last_match_id = rating.last_match_id
+
+
+def _write_checkpoint(db, seq: int, through_match_id: int, ratings: dict[str, PlayerRating]):
+    from database import RatingCheckpoint
+
+    for name, rating in ratings.items():
+        row = RatingCheckpoint(seq=seq, through_match_id=through_match_id, player=name)
+        _store_rating(row, rating)
+        db.add(row)
+
+
+class CheckpointObserver(ReplayObserver):
+    """Writes a rating checkpoint after every CHECKPOINT_EVERY-th completed match."""
+
+    def __init__(self, db, seq: int = 0):
+        self.db = db
+        self.seq = seq  # Completed matches applied before the replay starts
+
+    def after_match(self, m: dict, ratings: dict[str, PlayerRating]):
+        self.seq += 1
+        if self.seq % CHECKPOINT_EVERY == 0:
+            _write_checkpoint(self.db, self.seq, m["match_id"], ratings)
+
+
+def _load_checkpoint(db, through_match_id: int | None = None):
+    """Latest checkpoint at or before through_match_id (None: latest overall).
+
+    Returns:
+        (seq, checkpoint match_id, ratings); (0, None, initial ratings) if none
+    """
+    from database import RatingCheckpoint
+    from sqlalchemy import func
+
+    query = db.query(func.max(RatingCheckpoint.through_match_id))
+    if through_match_id is not None:
+        query = query.filter(RatingCheckpoint.through_match_id <= through_match_id)
+    checkpoint_id = query.scalar()
+    if checkpoint_id is None:
+        return 0, None, initial_ratings()
+
+    rows = (
+        db.query(RatingCheckpoint).filter(RatingCheckpoint.through_match_id == checkpoint_id).all()
+    )
+    ratings = {row.player: _row_to_rating(row) for row in rows}
+    return rows[0].seq, checkpoint_id, {p: ratings[p] for p in ALL_PLAYERS if p in ratings}
+
+
+def load_rating_state(db) -> dict[str, PlayerRating]:
+    """Persisted ratings (one query). Missing players mean no state yet.
+
+    No per-match history; replay with process_matches for that.
+    """
+    from database import RatingState
+
+    rows = {row.player: row for row in db.query(RatingState).all()}
+    return {p: _row_to_rating(rows[p]) for p in ALL_PLAYERS if p in rows}
+
+
+def rebuild_rating_state(db, from_match_id: int | None = None) -> dict[str, PlayerRating]:
+    """Replay completed matches into rating_state and rating_checkpoints (caller commits).
+
+    Replays from the latest checkpoint before from_match_id, dropping and
+    rewriting the checkpoints after it; from_match_id=None replays everything.
+    """
+    from database import RatingCheckpoint, RatingState
+
+    stale = db.query(RatingCheckpoint)
+    if from_match_id is not None:
+        stale = stale.filter(RatingCheckpoint.through_match_id >= from_match_id)
+    stale.delete(synchronize_session=False)
+
+    if from_match_id is None:
+        seq, checkpoint_id, ratings = 0, None, initial_ratings()
+    else:
+        seq, checkpoint_id, ratings = _load_checkpoint(db, from_match_id - 1)
+    replay(
+        query_completed_matches(db, after_match_id=checkpoint_id),
+        [CheckpointObserver(db, seq)],
+        ratings,
+    )
+
+    rows = {row.player: row for row in db.query(RatingState).with_for_update().all()}
+    for name, rating in ratings.items():
+        row = rows.get(name)
+        if row is None:
+            row = RatingState(player=name)
+            db.add(row)
+        _store_rating(row, rating)
+    for name, row in rows.items():
+        if name not in ratings:
+            db.delete(row)
     return ratings
 
 
+def advance_rating_state(db, match: dict) -> bool:
+    """Apply one newly completed match to rating_state (caller commits).
+
+    Only the two players' rows change when the match is newer than every
+    match already applied (plus a checkpoint on every CHECKPOINT_EVERY-th
+    match). Otherwise the state is replayed from the last checkpoint before
+    the match, so call this after the match row is flushed.
+
+    Returns:
+        True if applied incrementally, False if the state was replayed
+    """
+    from database import Match, RatingState
+
+    rows = {row.player: row for row in db.query(RatingState).with_for_update().all()}
+    if any(p not in rows for p in ALL_PLAYERS):
+        rebuild_rating_state(db)
+        return False
+    applied_through = max((row.last_match_id or 0 for row in rows.values()), default=0)
+    if match["match_id"] <= applied_through:
+        rebuild_rating_state(db, from_match_id=match["match_id"])
+        return False
+
+    players = (match["player1"], match["player2"])
+    ratings = {p: _row_to_rating(rows[p]) for p in players}
+    apply_match(ratings, match)
+    for p in players:
+        _store_rating(rows[p], ratings[p])
+
+    seq = db.query(Match).filter(Match.status == "Completed").count()
+    if seq % CHECKPOINT_EVERY == 0:
+        current = {p: _row_to_rating(rows[p]) for p in ALL_PLAYERS}
+        _write_checkpoint(db, seq, match["match_id"], current)
+    return True
+
+
+def ratings_as_of(db, match_id: int) -> dict[str, PlayerRating]:
+    """Ratings after every completed match with match_id <= match_id.
+
+    Loads the nearest checkpoint at or before match_id and replays only the
+    matches since it (at most CHECKPOINT_EVERY - 1 of them).
+    """
+    _, checkpoint_id, ratings = _load_checkpoint(db, match_id)
+    return replay(
+        query_completed_matches(db, after_match_id=checkpoint_id, through_match_id=match_id),
+        ratings=ratings,
+    )
+
+
+def check_rating_state(db) -> list[dict]:
+    """Compare rating_state with a full replay of completed matches.
+
+    Returns:
+        One entry per inconsistent player ({player, stored, replayed}), or
+        an empty list when the state matches the replay.
+    """
+    from database import RatingState
+
+    stored = {row.player: row for row in db.query(RatingState).all()}
+    mismatches = []
+    for name, rating in process_matches(query_completed_matches(db), history=False).items():
+        replayed = {
+            "elo": rating.elo,
+            "games_played": rating.games_played,
+            "wins": rating.wins,
+            "losses": rating.losses,
+            "draws": rating.draws,
+            "last_match_id": rating.last_match_id,
+        }
+        row = stored.get(name)
+        current = {key: getattr(row, key) for key in replayed} if row is not None else None
+        if (
+            current is None
+            or abs(current["elo"] - replayed["elo"]) > 1e-9
+            or any(current[key] != replayed[key] for key in replayed if key != "elo")
+        ):
+            mismatches.append({"player": name, "stored": current, "replayed": replayed})
+    return mismatches
+
+
+def _checkpoints_complete(db) -> bool:
+    """True if rating_checkpoints has one checkpoint per CHECKPOINT_EVERY matches."""
+    from database import Match, RatingCheckpoint
+    from sqlalchemy import func
+
+    completed = db.query(Match).filter(Match.status == "Completed").count()
+    checkpoints = db.query(func.count(func.distinct(RatingCheckpoint.seq))).scalar()
+    return checkpoints == completed // CHECKPOINT_EVERY
+
+
+def sync_rating_state():
+    """Build rating state and checkpoints if missing; rebuild if they differ from a replay.
+
+    Run at startup.
+    """
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if not load_rating_state(db) or not _checkpoints_complete(db):
+            print("[elo] Rating state or checkpoints missing; building them by full replay")
+            rebuild_rating_state(db)
+            db.commit()
+            return
+        mismatches = check_rating_state(db)
+        if mismatches:
+            print(
+                f"[elo] Rating state differs from replay for {len(mismatches)} players; "
+                "rebuilding"
+            )
+            rebuild_rating_state(db)
+            db.commit()
+    finally:
+        db.close()
+
+
 def get_elo_ratings() -> dict[str, PlayerRating]:
-    """Get current Elo ratings based on all completed matches."""
-    return process_matches(completed_matches())
+    """Get current Elo ratings from the persisted rating state.
+
+    A single query whatever the match history length; the state is built by
+    full replay on first use. No per-match history is attached — use
+    process_matches(completed_matches()) for that.
+    """
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        ratings = load_rating_state(db)
+        if len(ratings) < len(ALL_PLAYERS):
+            ratings = rebuild_rating_state(db)
+            db.commit()
+        return ratings
+    finally:
+        db.close()
 
 
 def run_backtest() -> dict:
@@ -200,72 +744,9 @@ def run_backtest() -> dict:
     Returns:
         dict with accuracy stats
     """
-    ratings: dict[str, PlayerRating] = {name: PlayerRating(name=name) for name in ALL_PLAYERS}
-
-    correct = 0
-    total = 0
-    wrong_predictions = []
-
-    for m in completed_matches():
-        if m["is_draw"]:
-            p1 = ratings[m["player1"]]
-            p2 = ratings[m["player2"]]
-            p1.games_played += 1
-            p1.draws += 1
-            p2.games_played += 1
-            p2.draws += 1
-            p1.record_snapshot(m["match_id"])
-            p2.record_snapshot(m["match_id"])
-            continue
-
-        if m["winner"] is None:
-            continue
-
-        p1 = ratings[m["player1"]]
-        p2 = ratings[m["player2"]]
-
-        # Predict: higher Elo player wins
-        # Skip first few matches where everyone is at 1500
-        if p1.games_played >= 2 and p2.games_played >= 2:
-            predicted_winner = m["player1"] if p1.elo >= p2.elo else m["player2"]
-            actual_winner = m["winner"]
-            total += 1
-            if predicted_winner == actual_winner:
-                correct += 1
-            else:
-                wrong_predictions.append(
-                    {
-                        "match_id": m["match_id"],
-                        "predicted": predicted_winner,
-                        "actual": actual_winner,
-                        "p1_elo": round(p1.elo, 1),
-                        "p2_elo": round(p2.elo, 1),
-                    }
-                )
-
-        # Now update Elo
-        winner_name = m["winner"]
-        loser_name = m["player2"] if m["player1"] == winner_name else m["player1"]
-        winner_score = m["score1"] if m["player1"] == winner_name else m["score2"]
-        loser_score = m["score2"] if m["player1"] == winner_name else m["score1"]
-
-        update_elo(
-            ratings[winner_name],
-            ratings[loser_name],
-            winner_score,
-            loser_score,
-            m["round"],
-            m["match_id"],
-        )
-
-    accuracy = correct / total if total > 0 else 0.0
-    return {
-        "correct": correct,
-        "total": total,
-        "accuracy": accuracy,
-        "accuracy_pct": round(accuracy * 100, 1),
-        "wrong_count": len(wrong_predictions),
-    }
+    backtest = BacktestObserver()
+    replay(completed_matches(), [backtest])
+    return backtest.result()
 
 
 def print_standings(ratings: dict[str, PlayerRating]):
@@ -295,20 +776,49 @@ if __name__ == "__main__":
     print("Fantasy Darts Elo Engine")
     print("=" * 40)
 
-    # Run full Elo calculation
-    ratings = get_elo_ratings()
+    from database import create_tables
+
+    create_tables()  # rating_state / rating_checkpoints on a fresh database
+
+    # Ratings and every diagnostic from one replay
+    diagnostics = run_diagnostics()
+    ratings = diagnostics["ratings"]
     print_standings(ratings)
 
     # Run backtest
     print("\n" + "=" * 40)
     print("BACKTEST RESULTS")
     print("=" * 40)
-    bt = run_backtest()
+    bt = diagnostics["backtest"]
     print(f"Predictions tested: {bt['total']}")
     print(f"Correct: {bt['correct']}")
     print(f"Wrong: {bt['wrong_count']}")
     print(f"Accuracy: {bt['accuracy_pct']}%")
 
+    print("\n" + "=" * 40)
+    print("CALIBRATION (pre-match Elo probability)")
+    print("=" * 40)
+    print(f"{'Bin':<11} {'N':>4} {'Pred':>6} {'Obs':>6}")
+    for c in diagnostics["calibration"]:
+        print(
+            f"{c['low']:.1f}-{c['high']:.1f}   {c['count']:>4} "
+            f"{c['predicted']:>6.3f} {c['observed']:>6.3f}"
+        )
+
+    print("\n" + "=" * 40)
+    print(f"UPSETS (winner's pre-match probability < {UPSET_THRESHOLD})")
+    print("=" * 40)
+    for u in diagnostics["upsets"]:
+        print(
+            f"  Match {u['match_id']:>3} R{u['round']:<3} {u['winner']} ({u['winner_elo']}) "
+            f"beat {u['loser']} ({u['loser_elo']}) {u['score']}, p={u['winner_prob']:.2f}"
+        )
+
+    # Persisted state must agree with the replay
+    assert all(
+        abs(ratings[p].elo - r.elo) < 1e-9 for p, r in get_elo_ratings().items()
+    ), "rating_state out of sync with replay"
+
     # Compare Elo rankings vs actual standings
     print("\n" + "=" * 40)
     print("ELO vs ACTUAL STANDINGS COMPARISON")
@@ -9,10 +9,12 @@ import os
 
 from database import Activity, WhatsAppLog, create_tables, get_db, migrate_add_columns
 from deps import manager
+from elo_engine import sync_rating_state
 from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse
 from match_data import seed_matches_from_csv
+from odds_snapshot import odds_snapshots
 from routes.admin import router as admin_router
 from routes.auth import router as auth_router
 from routes.bets import router as bets_router
@@ -56,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Odds-Snapshot-Version", "X-Odds-Snapshot-Age", "X-Simulation-Run"],
 )
 
 
@@ -89,6 +92,13 @@ async def startup():
     create_tables()
     migrate_add_columns()
     seed_matches_from_csv()
+    sync_rating_state()  # Build or repair the persisted Elo state
+    odds_snapshots.request_refresh()  # Warm the first odds snapshot in the background
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    odds_snapshots.shutdown()
 
 
 # ============================================================================
@@ -5,8 +5,11 @@ Seed source: data/tournament_database.csv (loaded once on first deploy).
 """
 
 import csv
+import functools
 import os
 
+from ranking import pack_scores, rank_order
+
 # Path to tournament data (relative to this file's directory)
 # Check for data in same directory first (Railway deployment), then parent (monorepo)
 _here = os.path.dirname(os.path.abspath(__file__))
@@ -15,6 +18,8 @@ if not os.path.isdir(DATA_DIR):
     DATA_DIR = os.path.join(_here, "..", "data")
 CSV_PATH = os.path.join(DATA_DIR, "tournament_database.csv")
 
+MATCH_TABLE_VERSION_KEY = "matches"  # data_versions row bumped by every match write
+
 # All 20 tournament players - full name to short key mapping
 PLAYER_KEY_MAP: dict[str, str] = {
     "Ali Celik": "ALI_CELIK",
@@ -147,6 +152,74 @@ def _load_from_db() -> list[dict]:
         db.close()
 
 
+def query_completed_matches(
+    db, after_match_id: int | None = None, through_match_id: int | None = None
+) -> list[dict]:
+    """Completed matches in match_id order, read through an open session.
+
+    Optionally limited to after_match_id < match_id <= through_match_id.
+    Unlike completed_matches(), this sees the session's own uncommitted writes.
+    """
+    from database import Match
+
+    query = db.query(Match).filter(Match.status == "Completed")
+    if after_match_id is not None:
+        query = query.filter(Match.match_id > after_match_id)
+    if through_match_id is not None:
+        query = query.filter(Match.match_id <= through_match_id)
+    return [_match_row_to_dict(r) for r in query.order_by(Match.match_id).all()]
+
+
+@functools.cache
+def _match_table_version_query():
+    from database import DataVersion
+    from sqlalchemy import select
+
+    return select(DataVersion.version).where(DataVersion.name == MATCH_TABLE_VERSION_KEY)
+
+
+def match_table_version() -> int:
+    """Current match-table version (0 before the first write).
+
+    One primary-key read of the data_versions row that every match write
+    bumps in its own transaction, so any process can tell cheaply whether
+    the matches changed since it last looked. It is checked on every cached
+    read, so it runs a prebuilt statement on a bare pooled connection (no
+    ORM session).
+    """
+    from database import engine
+
+    with engine.connect() as conn:
+        return conn.execute(_match_table_version_query()).scalar() or 0
+
+
+def _bump_match_table_version(db):
+    """Increment the match-table version inside the caller's transaction.
+
+    One atomic UPDATE; the first write on a fresh database creates the row
+    instead. If two first writers race to create it, the loser's insert
+    fails on the primary key inside a savepoint and it bumps the winner's
+    row, so neither write is aborted.
+    """
+    from database import DataVersion
+    from sqlalchemy.exc import IntegrityError
+
+    def bump() -> int:
+        return (
+            db.query(DataVersion)
+            .filter(DataVersion.name == MATCH_TABLE_VERSION_KEY)
+            .update({DataVersion.version: DataVersion.version + 1}, synchronize_session=False)
+        )
+
+    if bump():
+        return
+    try:
+        with db.begin_nested():
+            db.add(DataVersion(name=MATCH_TABLE_VERSION_KEY, version=1))
+    except IntegrityError:
+        bump()
+
+
 def seed_matches_from_csv(filepath: str = CSV_PATH):
     """Load CSV into the matches table if it is empty (idempotent).
 
@@ -175,6 +248,7 @@ def seed_matches_from_csv(filepath: str = CSV_PATH):
                     is_draw=m["is_draw"],
                 )
             )
+        _bump_match_table_version(db)
         db.commit()
     finally:
         db.close()
@@ -252,34 +326,53 @@ def get_player_record(player: str, completed: list[dict] | None = None) -> dict:
 
 
 def get_standings(completed: list[dict] | None = None) -> list[dict]:
-    """Get full tournament standings sorted by wins (desc), then leg diff (desc)."""
+    """Get full tournament standings sorted by wins, leg diff, then legs won (desc).
+
+    Ranked by the same kernel the simulators use (ranking.py).
+    """
     if completed is None:
         completed = get_completed_matches()
 
     records = [get_player_record(p, completed) for p in ALL_PLAYERS]
-    records.sort(key=lambda r: (-r["wins"], -r["leg_diff"], -r["legs_for"]))
-    return records
+    scores = pack_scores(
+        [r["wins"] for r in records],
+        [r["leg_diff"] for r in records],
+        [r["legs_for"] for r in records],
+    )
+    return [records[i] for i in rank_order(scores)]
 
 
 # ---------------------------------------------------------------------------
-# Module-level cache (cleared on every write so next read is fresh from DB)
+# Module-level cache, coherent across processes: every read compares the
+# match-table version with the one the cache was loaded at, so a write made
+# by any process (another uvicorn worker, the odds snapshot worker, a
+# script) is seen by the next read here.
 # ---------------------------------------------------------------------------
 
 _all_matches: list[dict] | None = None
 _completed: list[dict] | None = None
 _scheduled: list[dict] | None = None
+_loaded_version: int | None = None
 
 
 def _ensure_loaded():
-    global _all_matches, _completed, _scheduled
-    if _all_matches is None:
+    global _all_matches, _completed, _scheduled, _loaded_version
+    # Version first: a write landing during the load leaves the cache marked
+    # older than its data, so it is reloaded once more rather than kept stale.
+    version = match_table_version()
+    if _all_matches is None or version != _loaded_version:
         _all_matches = _load_from_db()
         _completed = get_completed_matches(_all_matches)
         _scheduled = get_scheduled_matches(_all_matches)
+        _loaded_version = version
 
 
 def invalidate_cache():
-    """Clear cached data so next access re-reads from DB."""
+    """Clear cached data so next access re-reads from DB.
+
+    Reads already reload after any versioned write; this is only needed
+    after changing the matches table some other way.
+    """
     global _all_matches, _completed, _scheduled
     _all_matches = None
     _completed = None
@@ -301,11 +394,13 @@ def write_match_result(
     """Write a match result to the database.
 
     Finds the row with matching match_id, updates scores/status/winner
-    and prop data fields, then invalidates the module cache.
+    and prop data fields, advances the persisted Elo state in the same
+    transaction, then invalidates the module cache.
 
     Raises ValueError if match not found or already completed.
     """
     from database import Match, SessionLocal
+    from elo_engine import advance_rating_state  # elo_engine imports this module
 
     db = SessionLocal()
     try:
@@ -332,6 +427,9 @@ def write_match_result(
         row.p2_180 = p2_180
         row.p1_ton_checkout = p1_ton_checkout
         row.p2_ton_checkout = p2_ton_checkout
+        db.flush()
+        advance_rating_state(db, _match_row_to_dict(row))
+        _bump_match_table_version(db)
         db.commit()
     finally:
         db.close()
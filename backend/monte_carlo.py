@@ -0,0 +1,730 @@
+"""Vectorized Monte Carlo engine for the outright tournament market.
+
+Simulates every iteration of the remaining round-robin at once with NumPy
+arrays instead of walking dicts:
+- Boolean win matrix of shape (iterations x scheduled matches)
+- Margin draws: 3-0 (30%), 3-1 (35%), 3-2 (35%)
+- Wins, leg-diff and legs-won totals built with a single scatter-add per batch
+- Tables ranked with the packed-score kernel in ranking.py
+
+The knockout bracket is not sampled. Once an iteration's top 8 is fixed,
+solve_bracket rolls the QF/SF/Final rounds forward exactly, so each
+iteration contributes fractional title probabilities instead of a single
+sampled champion (no knockout sampling noise).
+
+Precision can be adaptive: with a tolerance, blocks are run in waves and
+checked one by one in seed order until the standard error of every quoted
+player's title probability falls below it (or the iteration cap is hit).
+Stopping after k blocks gives exactly the same numbers as a fixed run of
+those k blocks, and k does not depend on the worker layout.
+
+Variance reduction is optional (VarianceReduction): antithetic pairs,
+common random numbers keyed by match_id, stratified margin rolls, or
+randomized quasi-Monte Carlo (scrambled Sobol points, needs scipy).
+
+With record_paths, every iteration also keeps a compact outcome record
+(PathRecords: bitset of scheduled-match winners, seeded top 8, exact title
+probabilities) so conditional "what-if" odds can be read off the stored
+paths by filtering instead of resimulating.
+
+Random streams are reproducible across cores. The run is cut into fixed
+blocks of SEED_BLOCK iterations and block b always draws from child b of
+SeedSequence(seed), so the aggregated counts depend only on (seed,
+iterations). Worker count and chunk size change how blocks are spread
+over processes, not the numbers they produce.
+
+The dict-based loop in odds_engine (_simulate_remaining_matches,
+_get_top_8, _simulate_knockout) stays as the reference implementation.
+Inputs come from an odds_engine.SimulationContext (read by attribute) so
+this module has no import dependency on the rest of the engine.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+from ranking import pack_scores, rank_order, top_k
+
+# --- Seed blocks ---
+
+# Iterations per independent random stream. Also the array batch size, so
+# it bounds peak memory at roughly SEED_BLOCK * n_scheduled * 8 bytes per
+# matrix. Changing it changes the sampled numbers for a given seed.
+SEED_BLOCK = 8192
+
+# Two-sided 95% normal quantile for confidence intervals
+Z_95 = 1.96
+
+# Points per independently scrambled Sobol replicate (quasi-Monte Carlo).
+# A power of two keeps Sobol balance; each replicate is one sampling unit
+# for standard errors, so a full block yields SEED_BLOCK // QMC_REPLICATE.
+QMC_REPLICATE = 1024
+
+# Margin distribution for a simulated win (same as the reference path)
+MARGIN_3_0 = 0.30
+MARGIN_3_1 = 0.65  # cumulative: 3-0 + 3-1
+
+# Seeded bracket as top-8 positions (0-based)
+# QF1: #1 vs #8, QF2: #4 vs #5, QF3: #2 vs #7, QF4: #3 vs #6
+QF_HIGHER = [0, 3, 1, 2]
+QF_LOWER = [7, 4, 6, 5]
+
+# SF1: QF1 winner vs QF2 winner, SF2: QF3 winner vs QF4 winner
+SF_SIDES = [([0, 7], [3, 4]), ([1, 6], [2, 5])]
+
+# Final: SF1 winner vs SF2 winner
+FINAL_SIDES = ([0, 7, 3, 4], [1, 6, 2, 5])
+
+
+@dataclass(frozen=True)
+class VarianceReduction:
+    """Variance-reduction options for the round-robin sampler.
+
+    Attributes:
+        antithetic: pair every match draw u with 1 - u (iterations i and
+            i + n/2 of a block). Standard errors are computed over pairs.
+        common_random_numbers: draw each scheduled match from its own stream
+            keyed by (seed, block, match_id) instead of by column position.
+            Two rating states then share the draws of every match they
+            both still have to play, so re-published odds move only
+            because of the new result, not because of re-sampling.
+        stratified_margins: Latin-hypercube the margin roll of every match
+            over the iterations of a block, so the 3-0 / 3-1 / 3-2 split is
+            exact per block. Rows are no longer independent, which makes
+            the reported standard error conservative.
+        quasi_monte_carlo: draw the win and margin uniforms of every
+            scheduled match from scrambled Sobol points instead of a
+            pseudo-random stream, in independently scrambled replicates of
+            QMC_REPLICATE iterations. Standard errors come from the spread
+            between replicates. Cannot be combined with the options above.
+    """
+
+    antithetic: bool = False
+    common_random_numbers: bool = False
+    stratified_margins: bool = False
+    quasi_monte_carlo: bool = False
+
+    def __post_init__(self):
+        if self.quasi_monte_carlo and (
+            self.antithetic or self.common_random_numbers or self.stratified_margins
+        ):
+            raise ValueError("quasi_monte_carlo cannot be combined with other variance options")
+        if self.quasi_monte_carlo:
+            try:
+                from scipy.stats import qmc  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "quasi_monte_carlo needs scipy, an optional dependency: pip install scipy"
+                ) from e
+
+    @property
+    def label(self) -> str:
+        names = [
+            name
+            for name, on in (
+                ("antithetic", self.antithetic),
+                ("crn", self.common_random_numbers),
+                ("stratified", self.stratified_margins),
+                ("qmc", self.quasi_monte_carlo),
+            )
+            if on
+        ]
+        return "+".join(names) or "plain"
+
+
+PLAIN = VarianceReduction()
+
+
+def _uniforms(
+    rng: np.random.Generator, n: int, m: int, variance: VarianceReduction
+) -> tuple[np.ndarray, np.ndarray]:
+    """Win and margin uniforms of shape (n, m) from one generator."""
+    if variance.antithetic:
+        first = rng.random((n - n // 2, m))
+        win_u = np.concatenate([first, 1.0 - first[: n // 2]])
+    else:
+        win_u = rng.random((n, m))
+
+    if variance.stratified_margins:
+        # One draw per stratum [k/n, (k+1)/n), strata shuffled per match
+        strata = rng.permuted(np.broadcast_to(np.arange(n)[:, None], (n, m)), axis=0)
+        margin_u = (strata + rng.random((n, m))) / n
+    elif variance.antithetic:
+        first = rng.random((n - n // 2, m))
+        margin_u = np.concatenate([first, 1.0 - first[: n // 2]])
+    else:
+        margin_u = rng.random((n, m))
+    return win_u, margin_u
+
+
+def _sobol_uniforms(rng: np.random.Generator, n: int, m: int) -> tuple[np.ndarray, np.ndarray]:
+    """Win and margin uniforms from scrambled Sobol replicates, each (n, m).
+
+    Dimensions 0..m-1 (the best-distributed ones) drive match winners,
+    m..2m-1 the margins. Every QMC_REPLICATE rows get a fresh scramble.
+    """
+    from scipy.stats import qmc
+
+    points = np.empty((n, 2 * m))
+    with warnings.catch_warnings():
+        # A short final replicate loses Sobol balance; it is still unbiased
+        warnings.simplefilter("ignore", UserWarning)
+        for start in range(0, n, QMC_REPLICATE):
+            size = min(QMC_REPLICATE, n - start)
+            points[start : start + size] = qmc.Sobol(2 * m, scramble=True, seed=rng).random(size)
+    return points[:, :m], points[:, m:]
+
+
+def draw_match_uniforms(
+    block_seed: np.random.SeedSequence,
+    n: int,
+    match_ids: np.ndarray,
+    variance: VarianceReduction = PLAIN,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Uniforms driving the win and margin outcome of every scheduled match.
+
+    Args:
+        block_seed: seed of this block (child of SeedSequence(seed))
+        n: iterations in the block
+        match_ids: (m,) ids of the scheduled matches, in column order
+        variance: sampling options
+
+    Returns:
+        (win_u, margin_u) arrays of shape (n, m)
+    """
+    m = match_ids.shape[0]
+    if variance.quasi_monte_carlo:
+        if m == 0:
+            return np.empty((n, 0)), np.empty((n, 0))
+        return _sobol_uniforms(np.random.default_rng(block_seed), n, m)
+    if not variance.common_random_numbers:
+        return _uniforms(np.random.default_rng(block_seed), n, m, variance)
+
+    win_u = np.empty((n, m))
+    margin_u = np.empty((n, m))
+    for j, match_id in enumerate(match_ids):
+        stream = np.random.SeedSequence(
+            block_seed.entropy, spawn_key=block_seed.spawn_key + (int(match_id),)
+        )
+        win_u[:, j : j + 1], margin_u[:, j : j + 1] = _uniforms(
+            np.random.default_rng(stream), n, 1, variance
+        )
+    return win_u, margin_u
+
+
+def simulate_round_robin(
+    win_prob: np.ndarray,
+    p1_idx: np.ndarray,
+    p2_idx: np.ndarray,
+    base_wins: np.ndarray,
+    base_leg_diff: np.ndarray,
+    base_legs_for: np.ndarray,
+    win_u: np.ndarray,
+    margin_u: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate all scheduled matches for n iterations.
+
+    Args:
+        win_prob: (m,) probability that player1 wins each scheduled match
+        p1_idx, p2_idx: (m,) player indices for each scheduled match
+        base_wins, base_leg_diff, base_legs_for: (P,) current record from
+            completed matches
+        win_u, margin_u: (n, m) uniforms from draw_match_uniforms
+
+    Returns:
+        (wins, leg_diff, legs_for) arrays of shape (n, P) with final
+        round-robin totals
+    """
+    n_players = base_wins.shape[0]
+    n, m = win_u.shape
+
+    wins = np.broadcast_to(base_wins, (n, n_players)).astype(np.int64)
+    leg_diff = np.broadcast_to(base_leg_diff, (n, n_players)).astype(np.int64)
+    legs_for = np.broadcast_to(base_legs_for, (n, n_players)).astype(np.int64)
+    if m == 0:
+        return wins, leg_diff, legs_for
+
+    p1_wins = win_u < win_prob
+    margin = np.where(margin_u < MARGIN_3_0, 3, np.where(margin_u < MARGIN_3_1, 2, 1))
+
+    winner = np.where(p1_wins, p1_idx, p2_idx)
+    loser = np.where(p1_wins, p2_idx, p1_idx)
+
+    # Scatter-add into a flattened (n * P) table: row offset + player index
+    offsets = (np.arange(n) * n_players)[:, None]
+    flat_w = (winner + offsets).ravel()
+    flat_l = (loser + offsets).ravel()
+    size = n * n_players
+
+    match_wins = np.bincount(flat_w, minlength=size).reshape(n, n_players)
+    wins += match_wins
+    margin_flat = margin.ravel()
+    leg_diff += (
+        np.bincount(flat_w, weights=margin_flat, minlength=size)
+        - np.bincount(flat_l, weights=margin_flat, minlength=size)
+    ).astype(np.int64).reshape(n, n_players)
+    # Winner takes 3 legs, loser 3 - margin
+    legs_for += 3 * match_wins + np.bincount(
+        flat_l, weights=3 - margin_flat, minlength=size
+    ).astype(np.int64).reshape(n, n_players)
+
+    return wins, leg_diff, legs_for
+
+
+def rank_standings(wins: np.ndarray, leg_diff: np.ndarray, legs_for: np.ndarray) -> np.ndarray:
+    """Return every iteration's final round-robin order, shape (n, P).
+
+    Same ordering as match_data.get_standings (see ranking.py).
+    """
+    return rank_order(pack_scores(wins, leg_diff, legs_for))
+
+
+def rank_top_8(wins: np.ndarray, leg_diff: np.ndarray, legs_for: np.ndarray) -> np.ndarray:
+    """Return seeded top 8 player indices for every iteration, shape (n, 8)."""
+    return top_k(pack_scores(wins, leg_diff, legs_for), 8)
+
+
+def _play_round(
+    top8: np.ndarray,
+    reach: np.ndarray,
+    side_a: list[int],
+    side_b: list[int],
+    table: np.ndarray,
+    out: np.ndarray,
+):
+    """Add P(win this round) for every seed on either side of one tie.
+
+    Each seed x on side_a meets each seed y on side_b with probability
+    reach[x] * reach[y]; x is the first-named player, so table[x, y] is
+    P(x beats y) and y wins with 1 - table[x, y].
+    """
+    for x in side_a:
+        for y in side_b:
+            p = table[top8[:, x], top8[:, y]]
+            meet = reach[:, x] * reach[:, y]
+            out[:, x] += meet * p
+            out[:, y] += meet * (1.0 - p)
+
+
+def solve_bracket(
+    top8: np.ndarray, ko_tables: dict[str, np.ndarray]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Exact SF / Final / title probabilities for seeded top-8 brackets.
+
+    Rolls the bracket forward round by round instead of sampling it.
+    ko_tables["QF"][h, l] is P(h beats l) with h the higher seed.
+    ko_tables["SF"] / ko_tables["Final"][a, b] is P(a beats b) with the
+    higher-Elo player treated as the higher seed.
+
+    Args:
+        top8: (n, 8) player indices in seed order, one bracket per row
+
+    Returns:
+        (reach_sf, reach_final, title) arrays of shape (n, 8) in seed order
+    """
+    n = top8.shape[0]
+
+    higher = top8[:, QF_HIGHER]
+    lower = top8[:, QF_LOWER]
+    p = ko_tables["QF"][higher, lower]
+    reach_sf = np.empty((n, 8))
+    reach_sf[:, QF_HIGHER] = p
+    reach_sf[:, QF_LOWER] = 1.0 - p
+
+    reach_final = np.zeros((n, 8))
+    for side_a, side_b in SF_SIDES:
+        _play_round(top8, reach_sf, side_a, side_b, ko_tables["SF"], reach_final)
+
+    title = np.zeros((n, 8))
+    _play_round(top8, reach_final, *FINAL_SIDES, ko_tables["Final"], title)
+
+    return reach_sf, reach_final, title
+
+
+@dataclass
+class PathRecords:
+    """Compact per-iteration outcome records of a simulation run.
+
+    Attributes:
+        match_ids: (m,) scheduled match ids, bit order of p1_won
+        p1_won: (n, ceil(m / 8)) uint8, bit j of a row set if player1 won
+            scheduled match j in that iteration (little-endian bit order)
+        top8: (n, 8) seeded top 8 player indices
+        title: (n, 8) exact title probability of each top-8 seed
+    """
+
+    match_ids: np.ndarray
+    p1_won: np.ndarray
+    top8: np.ndarray
+    title: np.ndarray
+
+    @property
+    def iterations(self) -> int:
+        return self.p1_won.shape[0]
+
+    @classmethod
+    def concat(cls, parts: list["PathRecords"]) -> "PathRecords":
+        return cls(
+            match_ids=parts[0].match_ids,
+            p1_won=np.concatenate([p.p1_won for p in parts]),
+            top8=np.concatenate([p.top8 for p in parts]),
+            title=np.concatenate([p.title for p in parts]),
+        )
+
+    def match_mask(self, conditions: list[tuple[int, bool]]) -> np.ndarray:
+        """Boolean (n,) mask of iterations where every (match_id, p1_won) holds."""
+        columns = {int(mid): j for j, mid in enumerate(self.match_ids)}
+        mask = np.ones(self.iterations, dtype=bool)
+        for match_id, p1_won in conditions:
+            j = columns[match_id]
+            bit = (self.p1_won[:, j >> 3] >> (j & 7)) & 1
+            mask &= bit.astype(bool) == p1_won
+        return mask
+
+    def aggregate(self, mask: np.ndarray, n_players: int) -> "SimulationResult":
+        """Title and top-8 counts over the iterations selected by mask."""
+        top8 = self.top8[mask].astype(np.int64)
+        title = self.title[mask].astype(float)
+        flat = top8.ravel()
+        return SimulationResult(
+            iterations=int(mask.sum()),
+            win_counts=np.bincount(flat, weights=title.ravel(), minlength=n_players),
+            win_sq=np.bincount(flat, weights=title.ravel() ** 2, minlength=n_players),
+            top8_counts=np.bincount(flat, minlength=n_players),
+        )
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outright simulation counts.
+
+    Attributes:
+        iterations: simulated tournaments aggregated so far
+        win_counts: (P,) expected title count (sum of per-iteration title
+            probabilities from the exact bracket)
+        win_sq: (P,) sum over sampling units of the squared mean title
+            probability within the unit, for standard errors
+        top8_counts: (P,) iterations in which each player made the top 8
+            (reached the QF)
+        units: independent sampling units (iterations, or antithetic pairs)
+        path_blocks: per-block PathRecords in block order (record_paths only)
+        position_counts: (P, P) iterations in which player i finished the
+            round-robin in position j (0-based); None if not tracked
+        sf_counts, final_counts: (P,) expected number of SF / Final
+            appearances (exact bracket); None if not tracked
+    """
+
+    iterations: int
+    win_counts: np.ndarray
+    win_sq: np.ndarray
+    top8_counts: np.ndarray
+    units: int | None = None
+    path_blocks: list[PathRecords] = field(default_factory=list)
+    position_counts: np.ndarray | None = None
+    sf_counts: np.ndarray | None = None
+    final_counts: np.ndarray | None = None
+
+    def __post_init__(self):
+        if self.units is None:
+            self.units = self.iterations
+
+    @classmethod
+    def empty(cls, n_players: int) -> "SimulationResult":
+        return cls(
+            iterations=0,
+            win_counts=np.zeros(n_players),
+            win_sq=np.zeros(n_players),
+            top8_counts=np.zeros(n_players, dtype=np.int64),
+            units=0,
+            position_counts=np.zeros((n_players, n_players), dtype=np.int64),
+            sf_counts=np.zeros(n_players),
+            final_counts=np.zeros(n_players),
+        )
+
+    def add(self, other: "SimulationResult"):
+        """Accumulate another (block) result in place."""
+        self.iterations += other.iterations
+        self.units += other.units
+        self.win_counts += other.win_counts
+        self.win_sq += other.win_sq
+        self.top8_counts += other.top8_counts
+        self.path_blocks.extend(other.path_blocks)
+        if self.position_counts is not None:
+            self.position_counts += other.position_counts
+            self.sf_counts += other.sf_counts
+            self.final_counts += other.final_counts
+
+    @property
+    def paths(self) -> PathRecords | None:
+        """All recorded paths, or None if the run did not record them."""
+        return PathRecords.concat(self.path_blocks) if self.path_blocks else None
+
+    @property
+    def win_prob(self) -> np.ndarray:
+        return self.win_counts / self.iterations
+
+    def distribution(self) -> np.ndarray:
+        """Finishing-position and knockout-reach probabilities, shape (P, P + 4).
+
+        Row i is player i. Columns 0..P-1: P(finish round-robin in position
+        j + 1); then P(reach QF), P(reach SF), P(reach Final), P(title).
+        """
+        n = self.iterations
+        return np.column_stack(
+            [
+                self.position_counts / n,
+                self.top8_counts / n,
+                self.sf_counts / n,
+                self.final_counts / n,
+                self.win_counts / n,
+            ]
+        )
+
+    @property
+    def std_error(self) -> np.ndarray:
+        """Standard error of each player's title probability estimate."""
+        n = self.units
+        if n < 2:
+            return np.full(self.win_counts.shape, np.inf)
+        mean = self.win_counts / self.iterations
+        var = np.maximum(self.win_sq / n - mean**2, 0.0) * n / (n - 1)
+        return np.sqrt(var / n)
+
+    def confidence_interval(self) -> tuple[np.ndarray, np.ndarray]:
+        """95% normal confidence interval per player, clipped to [0, 1]."""
+        half = Z_95 * self.std_error
+        return np.clip(self.win_prob - half, 0.0, 1.0), np.clip(self.win_prob + half, 0.0, 1.0)
+
+    def converged(self, tolerance: float, min_prob: float) -> bool:
+        """True once every quoted player (prob > min_prob) has SE <= tolerance."""
+        quoted = (self.top8_counts > 0) & (self.win_prob > min_prob)
+        return bool(np.all(self.std_error[quoted] <= tolerance))
+
+
+def _block_sizes(iterations: int) -> list[int]:
+    """Split a run into SEED_BLOCK-sized blocks (last one may be short)."""
+    full, rest = divmod(iterations, SEED_BLOCK)
+    return [SEED_BLOCK] * full + ([rest] if rest else [])
+
+
+def _simulate_blocks(
+    ctx,
+    block_seeds: list[np.random.SeedSequence],
+    block_sizes: list[int],
+    variance: VarianceReduction = PLAIN,
+    record_paths: bool = False,
+) -> list[SimulationResult]:
+    """Simulate consecutive seed blocks and return one result per block.
+
+    Module-level so ProcessPoolExecutor can pickle it for worker processes.
+    """
+    n_players = ctx.base_wins.shape[0]
+    partials = []
+    for block_seed, n in zip(block_seeds, block_sizes):
+        win_u, margin_u = draw_match_uniforms(block_seed, n, ctx.match_ids, variance)
+        wins, leg_diff, legs_for = simulate_round_robin(
+            ctx.win_prob,
+            ctx.p1_idx,
+            ctx.p2_idx,
+            ctx.base_wins,
+            ctx.base_leg_diff,
+            ctx.base_legs_for,
+            win_u,
+            margin_u,
+        )
+        # Full order, not just top 8: the position histogram needs every place
+        order = rank_standings(wins, leg_diff, legs_for)
+        top8 = order[:, :8]
+        reach_sf, reach_final, title = solve_bracket(top8, ctx.ko_tables)
+        flat = top8.ravel()
+
+        # Per-iteration title probability for every player, (n, P)
+        per_iter = np.zeros((n, n_players))
+        np.put_along_axis(per_iter, top8, title, axis=1)
+        if variance.antithetic:
+            # Row i and row n - n//2 + i are mirror images: one unit per pair
+            half = n // 2
+            unit_mean = per_iter[: n - half].copy()
+            unit_mean[:half] = (unit_mean[:half] + per_iter[n - half :]) / 2.0
+        elif variance.quasi_monte_carlo:
+            # One unit per independently scrambled replicate
+            starts = np.arange(0, n, QMC_REPLICATE)
+            sizes = np.diff(np.append(starts, n))
+            unit_mean = np.add.reduceat(per_iter, starts, axis=0) / sizes[:, None]
+        else:
+            unit_mean = per_iter
+
+        partials.append(
+            SimulationResult(
+                iterations=n,
+                win_counts=per_iter.sum(axis=0),
+                win_sq=(unit_mean**2).sum(axis=0),
+                top8_counts=np.bincount(flat, minlength=n_players),
+                units=unit_mean.shape[0],
+                # order[r, j] finished j-th: count (player, position) pairs
+                position_counts=np.bincount(
+                    (order * n_players + np.arange(n_players)).ravel(),
+                    minlength=n_players * n_players,
+                ).reshape(n_players, n_players),
+                sf_counts=np.bincount(flat, weights=reach_sf.ravel(), minlength=n_players),
+                final_counts=np.bincount(flat, weights=reach_final.ravel(), minlength=n_players),
+                path_blocks=[
+                    PathRecords(
+                        match_ids=ctx.match_ids,
+                        p1_won=np.packbits(win_u < ctx.win_prob, axis=1, bitorder="little"),
+                        top8=top8.astype(np.int16),
+                        title=title.astype(np.float32),
+                    )
+                ]
+                if record_paths
+                else [],
+            )
+        )
+    return partials
+
+
+def block_count(iterations: int) -> int:
+    """Number of seed blocks a run of `iterations` is cut into."""
+    return len(_block_sizes(iterations))
+
+
+def run_blocks(
+    ctx,
+    iterations: int,
+    seed: int,
+    start: int,
+    stop: int,
+    variance: VarianceReduction = PLAIN,
+) -> list[SimulationResult]:
+    """Simulate seed blocks [start, stop) of a run, one result per block.
+
+    Block b draws from SeedSequence(seed, spawn_key=(b,)), the same stream
+    as child b of SeedSequence(seed).spawn(), so adding every block's result
+    in order reproduces simulate_outright(ctx, iterations, seed) exactly.
+    Lets a caller drive a run piece by piece (e.g. to stream interim
+    estimates) from a worker process.
+    """
+    sizes = _block_sizes(iterations)[start:stop]
+    seeds = [np.random.SeedSequence(seed, spawn_key=(b,)) for b in range(start, stop)]
+    return _simulate_blocks(ctx, seeds, sizes, variance)
+
+
+def simulate_outright(
+    ctx,
+    iterations: int,
+    seed: int,
+    workers: int = 1,
+    chunk_size: int | None = None,
+    tolerance: float | None = None,
+    min_prob: float = 0.0,
+    variance: VarianceReduction = PLAIN,
+    record_paths: bool = False,
+) -> SimulationResult:
+    """Run the full outright simulation, optionally across worker processes.
+
+    Only the round-robin is sampled; each iteration's bracket is solved
+    exactly, so win_counts holds expected (fractional) title counts.
+
+    Args:
+        ctx: SimulationContext with the compiled schedule and knockout tables
+        iterations: total simulated tournaments (the cap in adaptive mode)
+        seed: base seed; block streams are SeedSequence(seed).spawn()
+        workers: worker processes (1 = run in this process)
+        chunk_size: iterations per task sent to a worker, rounded up to a
+            whole number of seed blocks (default: split evenly over workers,
+            or one block per task in adaptive mode)
+        tolerance: if set, stop after the first block (in seed order) at which
+            every player with win_prob > min_prob has a standard error <=
+            tolerance
+        variance: variance-reduction options (see VarianceReduction)
+        record_paths: keep per-iteration PathRecords (result.paths)
+
+    Returns:
+        SimulationResult. Bit-identical for a fixed (seed, iterations,
+        tolerance) whatever workers and chunk_size are.
+    """
+    sizes = _block_sizes(iterations)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    result = SimulationResult.empty(ctx.base_wins.shape[0])
+
+    if chunk_size is not None:
+        blocks_per_chunk = max(1, -(-chunk_size // SEED_BLOCK))
+    elif tolerance is not None:
+        blocks_per_chunk = 1
+    else:
+        blocks_per_chunk = max(1, -(-len(sizes) // max(workers, 1)))
+
+    # Blocks dispatched per wave; convergence is checked after every block
+    wave = blocks_per_chunk * max(workers, 1) if tolerance is not None else len(sizes)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(sizes) > 1 else None
+    try:
+        for start in range(0, len(sizes), max(wave, 1)):
+            wave_seeds = seeds[start : start + wave]
+            wave_sizes = sizes[start : start + wave]
+            if pool is None:
+                partials = _simulate_blocks(
+                    ctx, wave_seeds, wave_sizes, variance, record_paths
+                )
+            else:
+                starts = range(0, len(wave_sizes), blocks_per_chunk)
+                chunks = pool.map(
+                    _simulate_blocks,
+                    [ctx] * len(starts),
+                    [wave_seeds[i : i + blocks_per_chunk] for i in starts],
+                    [wave_sizes[i : i + blocks_per_chunk] for i in starts],
+                    [variance] * len(starts),
+                    [record_paths] * len(starts),
+                )
+                partials = [p for chunk in chunks for p in chunk]
+
+            # Sum and test in block order so neither the float totals nor the
+            # stopping block depend on the worker layout; surplus blocks of a
+            # converged wave are discarded
+            for partial in partials:
+                result.add(partial)
+                if tolerance is not None and result.converged(tolerance, min_prob):
+                    return result
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return result
+
+
+def measure_variance_reduction(
+    ctx,
+    variance: VarianceReduction,
+    iterations: int,
+    replications: int,
+    seed: int,
+    ctx_after=None,
+) -> float:
+    """Variance reduction factor of `variance` against plain sampling.
+
+    Runs `replications` independent simulations (seeds seed, seed + 1, ...)
+    with and without the options at the same iteration count and returns
+    var(plain) / var(variance), summed over players. A factor of 2 means
+    plain sampling needs twice the iterations for the same precision.
+
+    With ctx_after (the rating state after one more result), the quantity
+    measured is the change in title probability between the two states,
+    each side simulated from the same seed. That is what common random
+    numbers stabilise: odds movement on re-publish.
+    """
+
+    def estimates(options: VarianceReduction) -> np.ndarray:
+        rows = []
+        for r in range(replications):
+            before = simulate_outright(ctx, iterations, seed + r, variance=options).win_prob
+            if ctx_after is None:
+                rows.append(before)
+            else:
+                after = simulate_outright(ctx_after, iterations, seed + r, variance=options)
+                rows.append(after.win_prob - before)
+        return np.array(rows)
+
+    plain_var = estimates(PLAIN).var(axis=0, ddof=1).sum()
+    reduced_var = estimates(variance).var(axis=0, ddof=1).sum()
+    return float(plain_var / reduced_var) if reduced_var > 0 else float("inf")
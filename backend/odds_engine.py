@@ -2,7 +2,7 @@
 
 Generates match odds and outright tournament winner odds using:
 - Elo-based win probabilities
-- Monte Carlo simulation for outright market
+- Monte Carlo simulation for outright market (exact knockout bracket)
 - Power method overround at 108%
 - Knockout stage adjustments (shrinkage, choking, fatigue)
 
@@ -12,9 +12,13 @@ References:
     docs/ELO_K_FACTOR_RESEARCH.md
 """
 
+import hashlib
 import random
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 
+import monte_carlo
+import numpy as np
 from elo_engine import (
     INITIAL_ELO,
     PlayerRating,
@@ -24,9 +28,14 @@ from elo_engine import (
 )
 from match_data import (
     ALL_PLAYERS,
+    completed_matches,
     get_standings,
     scheduled_matches,
 )
+from ranking import pack_scores, top_k
+
+KNOCKOUT_STAGES = ("QF", "SF", "Final")
+KNOCKOUT_ORIENTATIONS = ("higher_seed", "lower_seed")  # Row player's seeding
 
 # --- Overround Constants ---
 
@@ -49,6 +58,38 @@ FATIGUE_FACTORS = {
 MC_ITERATIONS = 2000
 RANDOM_SEED = 42  # Reproducible results
 
+# Adaptive precision: simulate until every quoted player's title probability
+# has a standard error <= MC_TOLERANCE, capped at MC_MAX_ITERATIONS
+MC_TOLERANCE = 0.0005
+MC_MAX_ITERATIONS = 200_000
+
+OUTRIGHT_MIN_PROBABILITY = 0.001  # Quote players with > 0.1% chance
+
+# Sampling options for the published outright market (odds snapshot, seeded
+# markets), passed explicitly by those callers; the simulation functions
+# default to plain sampling. Common random numbers keep odds from
+# flickering on re-publish; antithetic pairs and stratified margins cut
+# variance (bench_outright.py --variance-reduction measures it).
+MC_VARIANCE_REDUCTION = monte_carlo.VarianceReduction(
+    antithetic=True, common_random_numbers=True, stratified_margins=True
+)
+
+# --- Result cache ---
+
+# Outright results and finishing distributions keyed by (context fingerprint,
+# iterations, seed, engine, tolerance, variance reduction); least recently
+# used entries are evicted beyond this size
+OUTRIGHT_CACHE_SIZE = 32
+_outright_cache: OrderedDict[tuple, tuple[list[dict], dict | None]] = OrderedDict()
+
+# Per-iteration path records of recent numpy runs made with record_paths (same
+# keys), for what-if queries. Kept small: a 200k-iteration run holds ~12 MB.
+PATH_CACHE_SIZE = 2
+_path_cache: OrderedDict[tuple, monte_carlo.PathRecords] = OrderedDict()
+
+# What-if answers from fewer surviving paths than this are flagged
+WHAT_IF_MIN_PATHS = 1000
+
 
 def apply_power_overround(true_probs: list[float], target_overround: float = 1.08) -> list[float]:
     """Apply Power method overround to true probabilities.
@@ -75,6 +116,80 @@ def apply_power_overround(true_probs: list[float], target_overround: float = 1.0
     return [p ** (1.0 / k) for p in true_probs]
 
 
+def apply_power_overround_batch(
+    markets: list[list[float]], target_overrounds: float | list[float] = 1.08
+) -> list[list[float]]:
+    """Power method overround for many markets in one vectorized solve.
+
+    Same result as apply_power_overround on each market (within 1e-9), but
+    every market's exponent t = 1/k is found together with a safeguarded
+    Halley iteration on f(t) = sum(p_i^t) - target: f is decreasing and
+    convex in t, each step is bracketed within the bisection's range
+    k in [0.01, 10], and steps that leave the bracket fall back to
+    bisection.
+
+    Args:
+        markets: ragged list of true probability vectors
+        target_overrounds: one target for all markets, or one per market
+
+    Returns:
+        Implied probabilities per market, in input order.
+    """
+    n_markets = len(markets)
+    if n_markets == 0:
+        return []
+
+    sizes = np.array([len(m) for m in markets], dtype=np.int64)
+    probs = np.fromiter((p for m in markets for p in m), dtype=float, count=int(sizes.sum()))
+    seg = np.repeat(np.arange(n_markets), sizes)
+    implied = _solve_power_overround(probs, seg, n_markets, target_overrounds)
+    return [chunk.tolist() for chunk in np.split(implied, np.cumsum(sizes)[:-1])]
+
+
+def power_overround_columns(probs: np.ndarray, target_overround: float = 1.08) -> np.ndarray:
+    """Power method overround for n equal-sized markets given as an (n, k) array."""
+    n_markets, k = probs.shape
+    seg = np.repeat(np.arange(n_markets), k)
+    return _solve_power_overround(probs.ravel(), seg, n_markets, target_overround).reshape(
+        n_markets, k
+    )
+
+
+def _solve_power_overround(
+    probs: np.ndarray, seg: np.ndarray, n_markets: int, target_overrounds
+) -> np.ndarray:
+    """Implied probabilities for flat probs, seg[i] = market of probs[i]."""
+    targets = np.broadcast_to(np.asarray(target_overrounds, dtype=float), (n_markets,))
+
+    positive = probs > 0
+    log_p = np.where(positive, np.log(np.where(positive, probs, 1.0)), 0.0)
+
+    lo = np.full(n_markets, 0.1)  # k = 10
+    hi = np.full(n_markets, 100.0)  # k = 0.01
+    t = np.ones(n_markets)
+    for _ in range(100):
+        w = np.where(positive, np.exp(t[seg] * log_p), 0.0)
+        f = np.bincount(seg, weights=w, minlength=n_markets) - targets
+        d1 = np.bincount(seg, weights=w * log_p, minlength=n_markets)
+        d2 = np.bincount(seg, weights=w * log_p**2, minlength=n_markets)
+
+        lo = np.where(f > 0, t, lo)  # sum too large -> root at larger t
+        hi = np.where(f < 0, t, hi)
+
+        denom = 2.0 * d1**2 - f * d2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_next = t - 2.0 * f * d1 / denom
+        outside = ~np.isfinite(t_next) | (t_next <= lo) | (t_next >= hi)
+        t_next = np.where(f == 0, t, np.where(outside, (lo + hi) / 2.0, t_next))
+
+        done = np.all(np.abs(t_next - t) <= 1e-15 * t)
+        t = t_next
+        if done:
+            break
+
+    return np.where(positive, np.exp(t[seg] * log_p), 0.0)
+
+
 def prob_to_decimal_odds(prob: float) -> float:
     """Convert probability to European decimal odds."""
     if prob <= 0:
@@ -82,6 +197,17 @@ def prob_to_decimal_odds(prob: float) -> float:
     return round(1.0 / prob, 2)
 
 
+def decimal_odds(probs: np.ndarray) -> np.ndarray:
+    """Vectorized prob_to_decimal_odds."""
+    with np.errstate(divide="ignore"):
+        return np.where(probs <= 0, 999.0, np.round(1.0 / probs, 2))
+
+
+def expected_scores(elo_a: np.ndarray, elo_b: np.ndarray) -> np.ndarray:
+    """Vectorized elo_engine.expected_score for player A."""
+    return 1.0 / (1.0 + 10.0 ** ((elo_b - elo_a) / 400.0))
+
+
 def knockout_probability(
     elo_a: float, elo_b: float, a_is_higher_seed: bool = True, stage: str = "QF"
 ) -> float:
@@ -122,74 +248,276 @@ def knockout_probability(
     return max(0.05, min(0.95, p_final))
 
 
-def get_match_odds(elo_ratings: dict[str, PlayerRating], sched_matches: list[dict]) -> list[dict]:
-    """Generate odds for all scheduled matches.
+@dataclass(frozen=True)
+class SimulationContext:
+    """Compiled rating state shared by every odds computation.
+
+    Built once per rating state by build_simulation_context(). Players are
+    mapped to integer indices (ALL_PLAYERS order) so hot loops index arrays
+    instead of looking up PlayerRating objects by name.
+
+    Attributes:
+        players: player names, position = index
+        index: player name -> index
+        elo: (P,) Elo per player (INITIAL_ELO if unrated)
+        sched: scheduled match dicts, aligned with the arrays below
+        match_ids: (m,) id of each scheduled match (common random number key)
+        p1_idx, p2_idx: (m,) player indices of each scheduled match
+        win_prob: (m,) expected_score for player1 of each scheduled match
+        base_wins, base_leg_diff: (P,) record from completed matches
+        base_legs_for: (P,) legs won in completed matches (third tiebreak)
+        ko_matrices: stage -> (2, P, P) knockout win probabilities for the
+            row player as higher seed [0] or lower seed [1]
+        ko_tables: stage -> (P, P) bracket lookups derived from ko_matrices.
+            QF: [h, l] with h the higher seed. SF/Final: [a, b] with the
+            higher-Elo player as higher seed.
+        fingerprint: hash of the rating state and schedule (cache key)
+    """
 
-    Returns list of dicts:
-        {match_id, round, player1, player2, prob1, prob2, odds1, odds2}
+    players: list[str]
+    index: dict[str, int]
+    elo: np.ndarray
+    sched: list[dict]
+    match_ids: np.ndarray
+    p1_idx: np.ndarray
+    p2_idx: np.ndarray
+    win_prob: np.ndarray
+    base_wins: np.ndarray
+    base_leg_diff: np.ndarray
+    base_legs_for: np.ndarray
+    ko_matrices: dict[str, np.ndarray]
+    ko_tables: dict[str, np.ndarray]
+    fingerprint: str
+
+    def elo_of(self, player: str) -> float:
+        """Elo for a player name (INITIAL_ELO for unknown players)."""
+        i = self.index.get(player)
+        return float(self.elo[i]) if i is not None else INITIAL_ELO
+
+
+def knockout_probability_matrix(elo: np.ndarray, stage: str) -> np.ndarray:
+    """Vectorized knockout_probability for every pair and seeding orientation.
+
+    Returns:
+        (2, P, P) array: [0, a, b] = P(a beats b) with a the higher seed,
+        [1, a, b] = the same with a the lower seed. The diagonal is 0.
+        Same arithmetic as knockout_probability, so values match it exactly.
     """
-    results = []
+    p_raw = expected_scores(elo[:, None], elo[None, :])
+    p_shrunk = KNOCKOUT_ALPHA * p_raw + (1 - KNOCKOUT_ALPHA) * 0.5
+    p_shrunk = np.where(p_shrunk > 0.5, p_shrunk - CHOKING_PENALTY, p_shrunk + CHOKING_PENALTY)
 
-    for m in sched_matches:
-        p1 = m["player1"]
-        p2 = m["player2"]
+    fatigue = FATIGUE_FACTORS.get(stage, 1.0)
+    matrices = np.stack([p_shrunk + THROW_ORDER_BONUS, p_shrunk - THROW_ORDER_BONUS])
+    matrices = np.clip(0.5 + (matrices - 0.5) * fatigue, 0.05, 0.95)
+    matrices[:, np.arange(len(elo)), np.arange(len(elo))] = 0.0
+    return matrices
 
-        elo1 = elo_ratings[p1].elo if p1 in elo_ratings else INITIAL_ELO
-        elo2 = elo_ratings[p2].elo if p2 in elo_ratings else INITIAL_ELO
 
-        # True probabilities
-        true_p1 = expected_score(elo1, elo2)
-        true_p2 = 1.0 - true_p1
+def _knockout_tables(ko_matrices: dict[str, np.ndarray], elo: np.ndarray) -> dict[str, np.ndarray]:
+    """Bracket lookup tables from the per-orientation matrices.
 
-        # Apply overround
-        implied = apply_power_overround([true_p1, true_p2], TARGET_OVERROUND_MATCH)
+    QF: [h, l] = P(h beats l) with h the higher seed.
+    SF/Final: [a, b] = P(a beats b) with the higher-Elo player as higher seed,
+    the same orientation the seeded bracket uses.
+    """
+    elo_higher = elo[:, None] >= elo[None, :]
+    tables = {"QF": ko_matrices["QF"][0]}
+    for stage in ("SF", "Final"):
+        tables[stage] = np.where(elo_higher, ko_matrices[stage][0], ko_matrices[stage][1])
+    return tables
 
-        results.append(
+
+def build_simulation_context(
+    elo_ratings: dict[str, PlayerRating],
+    sched: list[dict],
+    completed: list[dict] | None = None,
+) -> SimulationContext:
+    """Compile ratings, schedule and current standings into a SimulationContext."""
+    if completed is None:
+        completed = completed_matches()
+
+    players = list(ALL_PLAYERS)
+    index = {p: i for i, p in enumerate(players)}
+    elos = [elo_ratings[p].elo if p in elo_ratings else INITIAL_ELO for p in players]
+
+    p1_idx = np.array([index[m["player1"]] for m in sched], dtype=np.int64)
+    p2_idx = np.array([index[m["player2"]] for m in sched], dtype=np.int64)
+    elo = np.array(elos, dtype=float)
+    win_prob = expected_scores(elo[p1_idx], elo[p2_idx])
+
+    base_wins = np.zeros(len(players), dtype=np.int64)
+    base_leg_diff = np.zeros(len(players), dtype=np.int64)
+    base_legs_for = np.zeros(len(players), dtype=np.int64)
+    for r in get_standings(completed):
+        i = index[r["player"]]
+        base_wins[i] = r["wins"]
+        base_leg_diff[i] = r["leg_diff"]
+        base_legs_for[i] = r["legs_for"]
+
+    match_ids = np.array([m["match_id"] for m in sched], dtype=np.int64)
+    ko_matrices = {stage: knockout_probability_matrix(elo, stage) for stage in KNOCKOUT_STAGES}
+
+    digest = hashlib.sha256()
+    for arr in (elo, match_ids, p1_idx, p2_idx, base_wins, base_leg_diff, base_legs_for):
+        digest.update(arr.tobytes())
+
+    return SimulationContext(
+        players=players,
+        index=index,
+        elo=elo,
+        sched=sched,
+        match_ids=match_ids,
+        p1_idx=p1_idx,
+        p2_idx=p2_idx,
+        win_prob=win_prob,
+        base_wins=base_wins,
+        base_leg_diff=base_leg_diff,
+        base_legs_for=base_legs_for,
+        ko_matrices=ko_matrices,
+        ko_tables=_knockout_tables(ko_matrices, elo),
+        fingerprint=digest.hexdigest(),
+    )
+
+
+@dataclass(frozen=True)
+class MatchOddsTable:
+    """Columnar odds for every scheduled match; arrays of shape (m,).
+
+    Built in one array pass by get_match_odds_table(). Dicts are only
+    materialised at the API boundary (to_dicts).
+    """
+
+    players: list[str]
+    match_id: np.ndarray
+    round: np.ndarray
+    p1_idx: np.ndarray
+    p2_idx: np.ndarray
+    elo1: np.ndarray
+    elo2: np.ndarray
+    true_prob1: np.ndarray
+    true_prob2: np.ndarray
+    implied_prob1: np.ndarray
+    implied_prob2: np.ndarray
+    odds1: np.ndarray
+    odds2: np.ndarray
+
+    def __len__(self) -> int:
+        return self.match_id.shape[0]
+
+    def odds_by_pair(self) -> dict[tuple[str, str], tuple[float, float]]:
+        """(player1, player2) -> (odds1, odds2) for repricing open markets."""
+        return {
+            (self.players[i], self.players[j]): (o1, o2)
+            for i, j, o1, o2 in zip(
+                self.p1_idx.tolist(), self.p2_idx.tolist(), self.odds1.tolist(), self.odds2.tolist()
+            )
+        }
+
+    def to_dicts(self, limit: int | None = None) -> list[dict]:
+        """Row dicts (first `limit` matches), the get_match_odds format."""
+        n = len(self) if limit is None else min(limit, len(self))
+        cols = {
+            name: getattr(self, name)[:n].tolist()
+            for name in (
+                "match_id",
+                "round",
+                "p1_idx",
+                "p2_idx",
+                "elo1",
+                "elo2",
+                "true_prob1",
+                "true_prob2",
+                "implied_prob1",
+                "implied_prob2",
+                "odds1",
+                "odds2",
+            )
+        }
+        return [
             {
-                "match_id": m["match_id"],
-                "round": m["round"],
-                "player1": p1,
-                "player2": p2,
-                "elo1": round(elo1, 1),
-                "elo2": round(elo2, 1),
-                "true_prob1": round(true_p1, 4),
-                "true_prob2": round(true_p2, 4),
-                "implied_prob1": round(implied[0], 4),
-                "implied_prob2": round(implied[1], 4),
-                "odds1": prob_to_decimal_odds(implied[0]),
-                "odds2": prob_to_decimal_odds(implied[1]),
+                "match_id": cols["match_id"][r],
+                "round": cols["round"][r],
+                "player1": self.players[cols["p1_idx"][r]],
+                "player2": self.players[cols["p2_idx"][r]],
+                "elo1": round(cols["elo1"][r], 1),
+                "elo2": round(cols["elo2"][r], 1),
+                "true_prob1": round(cols["true_prob1"][r], 4),
+                "true_prob2": round(cols["true_prob2"][r], 4),
+                "implied_prob1": round(cols["implied_prob1"][r], 4),
+                "implied_prob2": round(cols["implied_prob2"][r], 4),
+                "odds1": cols["odds1"][r],
+                "odds2": cols["odds2"][r],
             }
-        )
+            for r in range(n)
+        ]
 
-    return results
 
+def price_match_columns(
+    elo1: np.ndarray, elo2: np.ndarray, target_overround: float = TARGET_OVERROUND_MATCH
+) -> dict[str, np.ndarray]:
+    """Head-to-head probabilities and odds for whole Elo vectors in one pass.
 
-def _simulate_remaining_matches(
-    elo_ratings: dict[str, PlayerRating], sched: list[dict], rng: random.Random
-) -> dict[str, dict]:
+    Returns columns true_prob1/2, implied_prob1/2 and odds1/2, each (m,).
+    """
+    true_prob1 = expected_scores(elo1, elo2)
+    true = np.column_stack([true_prob1, 1.0 - true_prob1])
+    implied = power_overround_columns(true, target_overround)
+    odds = decimal_odds(implied)
+    return {
+        "true_prob1": true[:, 0],
+        "true_prob2": true[:, 1],
+        "implied_prob1": implied[:, 0],
+        "implied_prob2": implied[:, 1],
+        "odds1": odds[:, 0],
+        "odds2": odds[:, 1],
+    }
+
+
+def get_match_odds_table(ctx: SimulationContext) -> MatchOddsTable:
+    """Price every scheduled match as columns (see MatchOddsTable)."""
+    elo1 = ctx.elo[ctx.p1_idx]
+    elo2 = ctx.elo[ctx.p2_idx]
+    return MatchOddsTable(
+        players=ctx.players,
+        match_id=ctx.match_ids,
+        round=np.array([m["round"] for m in ctx.sched], dtype=np.int64),
+        p1_idx=ctx.p1_idx,
+        p2_idx=ctx.p2_idx,
+        elo1=elo1,
+        elo2=elo2,
+        **price_match_columns(elo1, elo2),
+    )
+
+
+def get_match_odds(ctx: SimulationContext) -> list[dict]:
+    """Generate odds for all scheduled matches.
+
+    Returns list of dicts:
+        {match_id, round, player1, player2, elo1, elo2, true_prob1, true_prob2,
+         implied_prob1, implied_prob2, odds1, odds2}
+    """
+    return get_match_odds_table(ctx).to_dicts()
+
+
+def _simulate_remaining_matches(ctx: SimulationContext, rng: random.Random) -> dict[str, dict]:
     """Simulate remaining round-robin matches and return final standings.
 
-    Returns dict of player -> {wins, losses, draws, leg_diff} including
-    existing record from completed matches.
+    Returns dict of player -> {wins, leg_diff, legs_for} including the
+    existing record from completed matches, in ctx.players order.
     """
     # Start with current actual standings
-    current = get_standings()
     standings = {}
-    for r in current:
-        standings[r["player"]] = {
-            "wins": r["wins"],
-            "losses": r["losses"],
-            "draws": r["draws"],
-            "leg_diff": r["leg_diff"],
+    for i, player in enumerate(ctx.players):
+        standings[player] = {
+            "wins": int(ctx.base_wins[i]),
+            "leg_diff": int(ctx.base_leg_diff[i]),
+            "legs_for": int(ctx.base_legs_for[i]),
         }
 
-    for m in sched:
+    for m, prob_p1 in zip(ctx.sched, ctx.win_prob):
         p1 = m["player1"]
         p2 = m["player2"]
-        elo1 = elo_ratings[p1].elo if p1 in elo_ratings else INITIAL_ELO
-        elo2 = elo_ratings[p2].elo if p2 in elo_ratings else INITIAL_ELO
-
-        prob_p1 = expected_score(elo1, elo2)
 
         if rng.random() < prob_p1:
             # Player 1 wins - simulate score
@@ -208,22 +536,25 @@ def _simulate_remaining_matches(
 
         standings[winner]["wins"] += 1
         standings[winner]["leg_diff"] += w_score - l_score
-        standings[loser]["losses"] += 1
+        standings[winner]["legs_for"] += w_score
         standings[loser]["leg_diff"] -= w_score - l_score
+        standings[loser]["legs_for"] += l_score
 
     return standings
 
 
 def _get_top_8(standings: dict[str, dict]) -> list[str]:
-    """Get top 8 players sorted by wins desc, then leg_diff desc."""
+    """Get top 8 players by wins, leg_diff, then legs_for (ranking kernel)."""
     players = list(standings.keys())
-    players.sort(key=lambda p: (-standings[p]["wins"], -standings[p]["leg_diff"]))
-    return players[:8]
+    scores = pack_scores(
+        [standings[p]["wins"] for p in players],
+        [standings[p]["leg_diff"] for p in players],
+        [standings[p]["legs_for"] for p in players],
+    )
+    return [players[i] for i in top_k(scores[None, :], 8)[0]]
 
 
-def _simulate_knockout(
-    top8: list[str], elo_ratings: dict[str, PlayerRating], rng: random.Random
-) -> str:
+def _simulate_knockout(top8: list[str], ctx: SimulationContext, rng: random.Random) -> str:
     """Simulate seeded knockout bracket and return winner.
 
     Bracket: QF1: #1 vs #8, QF2: #4 vs #5, QF3: #2 vs #7, QF4: #3 vs #6
@@ -232,66 +563,39 @@ def _simulate_knockout(
     Final: SF1 winner vs SF2 winner
     """
     qf_matchups = [
-        (top8[0], top8[7], "QF"),  # #1 vs #8
-        (top8[3], top8[4], "QF"),  # #4 vs #5
-        (top8[1], top8[6], "QF"),  # #2 vs #7
-        (top8[2], top8[5], "QF"),  # #3 vs #6
+        (top8[0], top8[7]),  # #1 vs #8
+        (top8[3], top8[4]),  # #4 vs #5
+        (top8[1], top8[6]),  # #2 vs #7
+        (top8[2], top8[5]),  # #3 vs #6
     ]
 
+    qf = ctx.ko_tables["QF"]
     qf_winners = []
-    for higher_seed, lower_seed, stage in qf_matchups:
-        elo_h = elo_ratings[higher_seed].elo if higher_seed in elo_ratings else INITIAL_ELO
-        elo_l = elo_ratings[lower_seed].elo if lower_seed in elo_ratings else INITIAL_ELO
-
-        prob_h = knockout_probability(elo_h, elo_l, a_is_higher_seed=True, stage=stage)
+    for higher_seed, lower_seed in qf_matchups:
+        prob_h = qf[ctx.index[higher_seed], ctx.index[lower_seed]]
         winner = higher_seed if rng.random() < prob_h else lower_seed
         qf_winners.append(winner)
 
-    # Semi-finals: QF1w vs QF2w, QF3w vs QF4w
-    sf_matchups = [
-        (qf_winners[0], qf_winners[1], "SF"),
-        (qf_winners[2], qf_winners[3], "SF"),
-    ]
-
+    # Semi-finals: QF1w vs QF2w, QF3w vs QF4w (higher Elo = "higher seed")
+    sf = ctx.ko_tables["SF"]
     sf_winners = []
-    for p_a, p_b, stage in sf_matchups:
-        elo_a = elo_ratings[p_a].elo if p_a in elo_ratings else INITIAL_ELO
-        elo_b = elo_ratings[p_b].elo if p_b in elo_ratings else INITIAL_ELO
-
-        # Higher Elo = "higher seed" in semis
-        if elo_a >= elo_b:
-            prob_a = knockout_probability(elo_a, elo_b, a_is_higher_seed=True, stage=stage)
-        else:
-            prob_a = knockout_probability(elo_a, elo_b, a_is_higher_seed=False, stage=stage)
-
+    for p_a, p_b in [(qf_winners[0], qf_winners[1]), (qf_winners[2], qf_winners[3])]:
+        prob_a = sf[ctx.index[p_a], ctx.index[p_b]]
         winner = p_a if rng.random() < prob_a else p_b
         sf_winners.append(winner)
 
     # Final
     p_a, p_b = sf_winners[0], sf_winners[1]
-    elo_a = elo_ratings[p_a].elo if p_a in elo_ratings else INITIAL_ELO
-    elo_b = elo_ratings[p_b].elo if p_b in elo_ratings else INITIAL_ELO
-
-    if elo_a >= elo_b:
-        prob_a = knockout_probability(elo_a, elo_b, a_is_higher_seed=True, stage="Final")
-    else:
-        prob_a = knockout_probability(elo_a, elo_b, a_is_higher_seed=False, stage="Final")
-
+    prob_a = ctx.ko_tables["Final"][ctx.index[p_a], ctx.index[p_b]]
     return p_a if rng.random() < prob_a else p_b
 
 
-def get_outright_odds(
-    elo_ratings: dict[str, PlayerRating],
-    sched: list[dict],
-    iterations: int = MC_ITERATIONS,
-    seed: int = RANDOM_SEED,
-) -> list[dict]:
-    """Monte Carlo simulation for outright tournament winner odds.
-
-    Simulates remaining round-robin matches + knockout bracket.
+def _run_reference_simulation(
+    ctx: SimulationContext, iterations: int, seed: int
+) -> monte_carlo.SimulationResult:
+    """Dict-based reference Monte Carlo loop (one iteration at a time).
 
-    Returns list of dicts sorted by probability:
-        {player, wins_count, probability, implied_prob, odds}
+    Returns the counts as a SimulationResult so both engines report alike.
     """
     rng = random.Random(seed)
     win_counts: dict[str, int] = defaultdict(int)
@@ -299,7 +603,7 @@ def get_outright_odds(
 
     for _ in range(iterations):
         # Simulate remaining round-robin
-        standings = _simulate_remaining_matches(elo_ratings, sched, rng)
+        standings = _simulate_remaining_matches(ctx, rng)
 
         # Get top 8
         top8 = _get_top_8(standings)
@@ -307,38 +611,179 @@ def get_outright_odds(
             top8_counts[p] += 1
 
         # Simulate knockout
-        winner = _simulate_knockout(top8, elo_ratings, rng)
+        winner = _simulate_knockout(top8, ctx, rng)
         win_counts[winner] += 1
 
+    wins = np.array([win_counts[p] for p in ctx.players], dtype=float)
+    return monte_carlo.SimulationResult(
+        iterations=iterations,
+        win_counts=wins,
+        win_sq=wins.copy(),  # sampled titles are 0/1, so x^2 == x
+        top8_counts=np.array([top8_counts[p] for p in ctx.players], dtype=np.int64),
+    )
+
+
+def solve_knockout_bracket(ctx: SimulationContext, top8: list[str]) -> list[dict]:
+    """Exact knockout probabilities for a seeded top 8 (no sampling).
+
+    Rolls the QF/SF/Final bracket forward from the context's knockout tables
+    with the same seeding and orientation as _simulate_knockout.
+
+    Returns list of dicts in seed order:
+        {seed, player, reach_sf, reach_final, title}
+    """
+    bracket = np.array([[ctx.index[p] for p in top8]], dtype=np.int64)
+    reach_sf, reach_final, title = monte_carlo.solve_bracket(bracket, ctx.ko_tables)
+    return [
+        {
+            "seed": i + 1,
+            "player": player,
+            "reach_sf": float(reach_sf[0, i]),
+            "reach_final": float(reach_final[0, i]),
+            "title": float(title[0, i]),
+        }
+        for i, player in enumerate(top8)
+    ]
+
+
+def get_outright_odds(
+    ctx: SimulationContext,
+    iterations: int = MC_ITERATIONS,
+    seed: int = RANDOM_SEED,
+    engine: str = "numpy",
+    workers: int = 1,
+    chunk_size: int | None = None,
+    tolerance: float | None = None,
+    variance: monte_carlo.VarianceReduction = monte_carlo.PLAIN,
+    record_paths: bool = False,
+) -> list[dict]:
+    """Monte Carlo simulation for outright tournament winner odds.
+
+    Simulates remaining round-robin matches + knockout bracket.
+    engine="numpy" runs every iteration at once with arrays (monte_carlo.py)
+    and solves each iteration's bracket exactly; engine="python" runs the
+    dict-based reference loop, which samples the bracket.
+
+    workers > 1 spreads the numpy engine over a process pool in chunks of
+    chunk_size iterations. Results are identical for any workers and
+    chunk_size, with or without a tolerance.
+
+    With a tolerance (numpy engine only), iterations becomes a cap: the run
+    stops at the first seed block after which every quoted player's
+    standard error is <= tolerance, whatever the worker layout.
+
+    variance selects the numpy engine's variance-reduction options; the
+    python engine only supports monte_carlo.PLAIN.
+
+    record_paths (numpy engine only) also keeps the run's per-iteration
+    paths for get_what_if_odds; it costs extra time and memory, so only the
+    published snapshot asks for it.
+
+    Results are memoized per (ctx.fingerprint, iterations, seed, engine,
+    tolerance, variance), so repeated calls for the same rating state are O(1).
+    workers and chunk_size stay out of the key because they do not change
+    the result.
+
+    Returns list of dicts sorted by probability:
+        {player, wins_count, probability, implied_prob, odds,
+         iterations, std_error, ci_low, ci_high}
+    """
+    key = (ctx.fingerprint, iterations, seed, engine, tolerance, variance)
+    cached = _outright_cache.get(key)
+    if cached is not None and (not record_paths or key in _path_cache):
+        _outright_cache.move_to_end(key)
+        return [dict(r) for r in cached[0]]
+
+    sim = _run_outright_simulation(
+        ctx, iterations, seed, engine, workers, chunk_size, tolerance, variance, record_paths
+    )
+    results = price_outright(ctx, sim)
+    distribution = _finishing_distribution(ctx, sim) if sim.position_counts is not None else None
+
+    _outright_cache[key] = (results, distribution)
+    while len(_outright_cache) > OUTRIGHT_CACHE_SIZE:
+        _outright_cache.popitem(last=False)
+    if sim.path_blocks:
+        _path_cache[key] = sim.paths
+        while len(_path_cache) > PATH_CACHE_SIZE:
+            _path_cache.popitem(last=False)
+    return [dict(r) for r in results]
+
+
+def _run_outright_simulation(
+    ctx: SimulationContext,
+    iterations: int,
+    seed: int,
+    engine: str,
+    workers: int,
+    chunk_size: int | None,
+    tolerance: float | None,
+    variance: monte_carlo.VarianceReduction,
+    record_paths: bool,
+) -> monte_carlo.SimulationResult:
+    """Run the outright simulation on the chosen engine (uncached)."""
+    if engine == "numpy":
+        return monte_carlo.simulate_outright(
+            ctx,
+            iterations,
+            seed,
+            workers=workers,
+            chunk_size=chunk_size,
+            tolerance=tolerance,
+            min_prob=OUTRIGHT_MIN_PROBABILITY,
+            variance=variance,
+            record_paths=record_paths,
+        )
+    if engine == "python":
+        if tolerance is not None:
+            raise ValueError("Adaptive precision (tolerance) requires the numpy engine")
+        if variance != monte_carlo.PLAIN:
+            raise ValueError("Variance reduction requires the numpy engine")
+        if record_paths:
+            raise ValueError("Path recording requires the numpy engine")
+        return _run_reference_simulation(ctx, iterations, seed)
+    raise ValueError(f"Unknown simulation engine '{engine}' (expected 'numpy' or 'python')")
+
+
+def price_outright(ctx: SimulationContext, sim: monte_carlo.SimulationResult) -> list[dict]:
+    """Price the outright market from simulation counts."""
+    probs = sim.win_prob
+    std_errors = sim.std_error
+    ci_low, ci_high = sim.confidence_interval()
+
     # Convert to probabilities
     results = []
     true_probs = []
-    players_in_market = []
+    quoted = []
 
     # Only include players who made top 8 at least once
-    for player in ALL_PLAYERS:
-        if top8_counts[player] > 0:
-            prob = win_counts[player] / iterations
-            if prob > 0.001:  # Include if > 0.1% chance
+    for i, player in enumerate(ctx.players):
+        if sim.top8_counts[i] > 0:
+            prob = float(probs[i])
+            if prob > OUTRIGHT_MIN_PROBABILITY:
                 true_probs.append(prob)
-                players_in_market.append(player)
+                quoted.append(i)
 
     # Apply overround to all qualifying players
     if true_probs:
-        implied_probs = apply_power_overround(true_probs, TARGET_OVERROUND_OUTRIGHT)
+        implied_probs = apply_power_overround_batch([true_probs], TARGET_OVERROUND_OUTRIGHT)[0]
     else:
         implied_probs = true_probs
 
-    for player, true_p, impl_p in zip(players_in_market, true_probs, implied_probs):
+    for i, true_p, impl_p in zip(quoted, true_probs, implied_probs):
         results.append(
             {
-                "player": player,
-                "wins_count": win_counts[player],
-                "top8_count": top8_counts[player],
-                "top8_pct": round(top8_counts[player] / iterations * 100, 1),
+                "player": ctx.players[i],
+                "wins_count": round(float(sim.win_counts[i]), 2),
+                "top8_count": int(sim.top8_counts[i]),
+                "top8_pct": round(sim.top8_counts[i] / sim.iterations * 100, 1),
                 "true_probability": round(true_p, 4),
                 "implied_probability": round(impl_p, 4),
                 "odds": prob_to_decimal_odds(impl_p),
+                "iterations": sim.iterations,
+                "std_error": round(float(std_errors[i]), 5),
+                "ci_low": round(float(ci_low[i]), 4),
+                "ci_high": round(float(ci_high[i]), 4),
             }
         )
 
@@ -346,9 +791,45 @@ def get_outright_odds(
     return results
 
 
-def get_quarterfinal_matchup_odds(
-    elo_ratings: dict[str, PlayerRating], top8: list[str]
-) -> list[dict]:
+def _finishing_distribution(ctx: SimulationContext, sim: monte_carlo.SimulationResult) -> dict:
+    """Compact finishing-position / knockout-reach matrix for a simulation run."""
+    n_players = len(ctx.players)
+    return {
+        "players": list(ctx.players),
+        "columns": [f"pos_{j}" for j in range(1, n_players + 1)]
+        + ["reach_qf", "reach_sf", "reach_final", "title"],
+        "iterations": sim.iterations,
+        "matrix": np.round(sim.distribution(), 4).tolist(),
+    }
+
+
+def get_finishing_distribution(
+    ctx: SimulationContext,
+    iterations: int = MC_MAX_ITERATIONS,
+    seed: int = RANDOM_SEED,
+    tolerance: float | None = MC_TOLERANCE,
+    variance: monte_carlo.VarianceReduction = monte_carlo.PLAIN,
+) -> dict:
+    """Finishing-position distribution from the outright run with these settings.
+
+    Comes from the same simulation as get_outright_odds (the published market
+    with variance=MC_VARIANCE_REDUCTION), so "top 4 finish", "to reach the
+    final" or "bottom finisher" markets cost no extra run.
+
+    Returns dict:
+        {players, columns, iterations, matrix}
+        matrix[i] is players[i]; columns pos_1..pos_P are round-robin
+        finishing-position probabilities, then reach_qf, reach_sf,
+        reach_final and title.
+    """
+    key = (ctx.fingerprint, iterations, seed, "numpy", tolerance, variance)
+    if key not in _outright_cache:
+        get_outright_odds(ctx, iterations, seed, tolerance=tolerance, variance=variance)
+    _outright_cache.move_to_end(key)
+    return _outright_cache[key][1]
+
+
+def get_quarterfinal_matchup_odds(ctx: SimulationContext, top8: list[str]) -> list[dict]:
     """Generate odds for quarterfinal matchups based on seeded bracket.
 
     Bracket: QF1: #1 vs #8, QF2: #4 vs #5, QF3: #2 vs #7, QF4: #3 vs #6
@@ -360,23 +841,23 @@ def get_quarterfinal_matchup_odds(
         ("QF4", top8[2], top8[5]),
     ]
 
-    results = []
-    for label, higher, lower in matchups:
-        elo_h = elo_ratings[higher].elo
-        elo_l = elo_ratings[lower].elo
-
-        prob_h = knockout_probability(elo_h, elo_l, a_is_higher_seed=True, stage="QF")
-        prob_l = 1.0 - prob_h
-
-        implied = apply_power_overround([prob_h, prob_l], TARGET_OVERROUND_MATCH)
+    true_probs = []
+    for _, higher, lower in matchups:
+        prob_h = float(ctx.ko_tables["QF"][ctx.index[higher], ctx.index[lower]])
+        true_probs.append([prob_h, 1.0 - prob_h])
+    implied_all = apply_power_overround_batch(true_probs, TARGET_OVERROUND_MATCH)
 
+    results = []
+    for (label, higher, lower), (prob_h, prob_l), implied in zip(
+        matchups, true_probs, implied_all
+    ):
         results.append(
             {
                 "label": label,
                 "higher_seed": higher,
                 "lower_seed": lower,
-                "elo_higher": round(elo_h, 1),
-                "elo_lower": round(elo_l, 1),
+                "elo_higher": round(ctx.elo_of(higher), 1),
+                "elo_lower": round(ctx.elo_of(lower), 1),
                 "true_prob_higher": round(prob_h, 4),
                 "true_prob_lower": round(prob_l, 4),
                 "odds_higher": prob_to_decimal_odds(implied[0]),
@@ -387,13 +868,126 @@ def get_quarterfinal_matchup_odds(
     return results
 
 
+def get_knockout_matrix(ctx: SimulationContext, stage: str) -> dict:
+    """Head-to-head knockout win probabilities for one stage, both orientations.
+
+    higher_seed[i][j] is P(players[i] beats players[j]) with players[i] as the
+    higher seed (throws first); lower_seed[i][j] with players[i] as the lower
+    seed. QF seeding comes from the group table; in SF/Final the higher-Elo
+    player is the higher seed.
+
+    Raises:
+        ValueError: unknown stage
+    """
+    if stage not in KNOCKOUT_STAGES:
+        raise ValueError(f"Unknown stage {stage!r}; expected one of {', '.join(KNOCKOUT_STAGES)}")
+    matrices = np.round(ctx.ko_matrices[stage], 4)
+    return {
+        "stage": stage,
+        "players": ctx.players,
+        "elo": [round(float(e), 1) for e in ctx.elo],
+        "higher_seed": matrices[0].tolist(),
+        "lower_seed": matrices[1].tolist(),
+    }
+
+
+def get_what_if_odds(
+    ctx: SimulationContext,
+    conditions: list[tuple[int, str]],
+    iterations: int = MC_MAX_ITERATIONS,
+    seed: int = RANDOM_SEED,
+    tolerance: float | None = MC_TOLERANCE,
+    variance: monte_carlo.VarianceReduction = monte_carlo.PLAIN,
+) -> dict:
+    """Conditional outright probabilities given scheduled-match winners.
+
+    Filters the stored paths of the outright run with the same settings
+    (the published market with variance=MC_VARIANCE_REDUCTION) to the
+    iterations in which every
+    (match_id, winner) condition holds; nothing is resimulated unless those
+    paths have been evicted from the cache.
+
+    Raises ValueError for an unknown match or a winner not in that match.
+
+    Returns dict:
+        {conditions, paths_total, paths_matched, sufficient_paths,
+         odds: [{player, true_probability, baseline_probability, top8_pct,
+                 std_error}]}
+    """
+    by_id = {m["match_id"]: m for m in ctx.sched}
+    resolved = []
+    for match_id, winner in conditions:
+        m = by_id.get(match_id)
+        if m is None:
+            raise ValueError(f"Match {match_id} is not a scheduled match")
+        if winner not in (m["player1"], m["player2"]):
+            raise ValueError(
+                f"Winner '{winner}' must be one of: '{m['player1']}' or '{m['player2']}'"
+            )
+        resolved.append((m, winner))
+
+    key = (ctx.fingerprint, iterations, seed, "numpy", tolerance, variance)
+    paths = _path_cache.get(key)
+    if paths is None:
+        get_outright_odds(
+            ctx, iterations, seed, tolerance=tolerance, variance=variance, record_paths=True
+        )
+        paths = _path_cache[key]
+    _path_cache.move_to_end(key)
+
+    n_players = len(ctx.players)
+    baseline = paths.aggregate(np.ones(paths.iterations, dtype=bool), n_players)
+    mask = paths.match_mask([(m["match_id"], winner == m["player1"]) for m, winner in resolved])
+    conditional = paths.aggregate(mask, n_players)
+
+    odds = []
+    if conditional.iterations > 0:
+        probs = conditional.win_prob
+        std_errors = conditional.std_error
+        for i, player in enumerate(ctx.players):
+            if conditional.top8_counts[i] > 0 or baseline.win_counts[i] > 0:
+                odds.append(
+                    {
+                        "player": player,
+                        "true_probability": round(float(probs[i]), 4),
+                        "baseline_probability": round(float(baseline.win_prob[i]), 4),
+                        "top8_pct": round(
+                            conditional.top8_counts[i] / conditional.iterations * 100, 1
+                        ),
+                        "std_error": round(float(std_errors[i]), 5),
+                    }
+                )
+        odds.sort(key=lambda r: -r["true_probability"])
+
+    return {
+        "conditions": [
+            {
+                "match_id": m["match_id"],
+                "player1": m["player1"],
+                "player2": m["player2"],
+                "winner": winner,
+            }
+            for m, winner in resolved
+        ],
+        "paths_total": paths.iterations,
+        "paths_matched": conditional.iterations,
+        "sufficient_paths": conditional.iterations >= WHAT_IF_MIN_PATHS,
+        "odds": odds,
+    }
+
+
 if __name__ == "__main__":
     print("Fantasy Darts Odds Engine")
     print("=" * 60)
 
+    from database import create_tables
+
+    create_tables()  # rating_state / rating_checkpoints on a fresh database
+
     # Get current Elo ratings
     ratings = get_elo_ratings()
     sched = scheduled_matches()
+    ctx = build_simulation_context(ratings, sched)
 
     print(f"\nScheduled matches: {len(sched)}")
 
@@ -401,7 +995,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("UPCOMING MATCH ODDS (next 10)")
     print("=" * 60)
-    match_odds = get_match_odds(ratings, sched)
+    match_odds = get_match_odds(ctx)
 
     print(f"{'ID':>4} {'R':>3}  {'Player 1':<22} {'Odds':>6}  {'Player 2':<22} {'Odds':>6}")
     print("-" * 80)
@@ -417,7 +1011,7 @@ if __name__ == "__main__":
     print("OUTRIGHT TOURNAMENT WINNER ODDS")
     print(f"(Monte Carlo: {MC_ITERATIONS} iterations)")
     print("=" * 60)
-    outright = get_outright_odds(ratings, sched)
+    outright = get_outright_odds(ctx)
 
     print(f"{'Rank':>4} {'Player':<25} {'Win%':>6} {'Top8%':>6} {'Odds':>7}")
     print("-" * 55)
@@ -438,7 +1032,8 @@ if __name__ == "__main__":
     sorted_ratings = get_sorted_ratings(ratings)
     current_top8 = [name for name, _ in sorted_ratings[:8]]
 
-    qf_odds = get_quarterfinal_matchup_odds(ratings, current_top8)
+    qf_odds = get_quarterfinal_matchup_odds(ctx, current_top8)
+    bracket = solve_knockout_bracket(ctx, current_top8)
     for qf in qf_odds:
         print(
             f"\n{qf['label']}: #{current_top8.index(qf['higher_seed'])+1} "
@@ -450,3 +1045,144 @@ if __name__ == "__main__":
             f"  {qf['higher_seed']}: {qf['odds_higher']:.2f}  |  "
             f"{qf['lower_seed']}: {qf['odds_lower']:.2f}"
         )
+
+    print(f"\n{'Seed':>4} {'Player':<25} {'SF%':>6} {'Final%':>7} {'Title%':>7}")
+    print("-" * 55)
+    for b in bracket:
+        print(
+            f"{b['seed']:>4} {b['player']:<25} {b['reach_sf'] * 100:>5.1f}% "
+            f"{b['reach_final'] * 100:>6.1f}% {b['title'] * 100:>6.1f}%"
+        )
+
+    # Precomputed knockout matrices vs the scalar formula
+    ko_diff = max(
+        abs(
+            ctx.ko_matrices[stage][o, a, b]
+            - knockout_probability(ctx.elo[a], ctx.elo[b], a_is_higher_seed=o == 0, stage=stage)
+        )
+        for stage in KNOCKOUT_STAGES
+        for o in range(len(KNOCKOUT_ORIENTATIONS))
+        for a in range(len(ctx.players))
+        for b in range(len(ctx.players))
+        if a != b
+    )
+    print(f"\nMax |knockout matrix - knockout_probability|: {ko_diff:.2e}")
+    assert ko_diff < 1e-12
+
+    # Vectorized engine vs dict-based reference: agreement within sampling error
+    print("\n" + "=" * 60)
+    print("ENGINE AGREEMENT (numpy vs python reference)")
+    print("=" * 60)
+
+    ref_iterations = MC_ITERATIONS
+    vec_iterations = 100_000
+    ref = {
+        o["player"]: o
+        for o in get_outright_odds(ctx, ref_iterations, engine="python")
+    }
+    vec = {o["player"]: o for o in get_outright_odds(ctx, vec_iterations)}
+
+    max_z = 0.0
+    for player in ALL_PLAYERS:
+        p_ref = ref[player]["wins_count"] / ref_iterations if player in ref else 0.0
+        p_vec = vec[player]["wins_count"] / vec_iterations if player in vec else 0.0
+        p_pool = (p_ref * ref_iterations + p_vec * vec_iterations) / (
+            ref_iterations + vec_iterations
+        )
+        se = (p_pool * (1 - p_pool) * (1 / ref_iterations + 1 / vec_iterations)) ** 0.5
+        if se > 0:
+            max_z = max(max_z, abs(p_ref - p_vec) / se)
+    print(f"Max |z| across players: {max_z:.2f} (|z| < 4 expected)")
+    assert max_z < 4, max_z
+
+    # Adaptive precision: pay only for the precision we need
+    print("\n" + "=" * 60)
+    print(f"ADAPTIVE PRECISION (SE <= {MC_TOLERANCE}, cap {MC_MAX_ITERATIONS:,})")
+    print("=" * 60)
+    adaptive = get_outright_odds(ctx, MC_MAX_ITERATIONS, tolerance=MC_TOLERANCE)
+    print(f"Iterations used: {adaptive[0]['iterations']:,}")
+    print(f"{'Player':<25} {'Win%':>6} {'95% CI':>16}")
+    for o in adaptive:
+        print(
+            f"{o['player']:<25} {o['true_probability'] * 100:>5.1f}% "
+            f"[{o['ci_low'] * 100:>5.1f}%, {o['ci_high'] * 100:>5.1f}%]"
+        )
+
+    # The stopping block depends only on (seed, tolerance), not the worker layout
+    layouts = [(1, None), (4, None), (2, 3 * monte_carlo.SEED_BLOCK)]
+    runs = [
+        monte_carlo.simulate_outright(
+            ctx,
+            MC_MAX_ITERATIONS,
+            RANDOM_SEED,
+            workers=workers,
+            chunk_size=chunk_size,
+            tolerance=4e-4,
+            min_prob=OUTRIGHT_MIN_PROBABILITY,
+        )
+        for workers, chunk_size in layouts
+    ]
+    print(f"Stop at SE <= 4e-4 for (workers, chunk_size) in {layouts}: ", end="")
+    print(", ".join(f"{r.iterations:,}" for r in runs))
+    for r in runs[1:]:
+        assert r.iterations == runs[0].iterations
+        assert np.array_equal(r.win_counts, runs[0].win_counts)
+
+    # What-if: condition the stored paths on the next two scheduled results
+    print("\n" + "=" * 60)
+    print("WHAT-IF (from stored paths, no resimulation)")
+    print("=" * 60)
+    conditions = [(m["match_id"], m["player2"]) for m in sched[:2]]
+    what_if = get_what_if_odds(ctx, conditions)
+    for c in what_if["conditions"]:
+        print(f"  Match {c['match_id']}: {c['winner']} beats ", end="")
+        print(c["player1"] if c["winner"] == c["player2"] else c["player2"])
+    print(f"Paths matched: {what_if['paths_matched']:,} / {what_if['paths_total']:,}")
+    print(f"{'Player':<25} {'Win%':>6} {'Base%':>6}")
+    for o in what_if["odds"][:8]:
+        print(
+            f"{o['player']:<25} {o['true_probability'] * 100:>5.1f}% "
+            f"{o['baseline_probability'] * 100:>5.1f}%"
+        )
+
+    # Finishing distribution from the same run
+    print("\n" + "=" * 60)
+    print("FINISHING DISTRIBUTION (same run as the outright market)")
+    print("=" * 60)
+    dist = get_finishing_distribution(ctx)
+    n_players = len(dist["players"])
+    print(f"{'Player':<25} {'Top4%':>6} {'Last%':>6} {'SF%':>6} {'Final%':>7}")
+    for player, row in zip(dist["players"], dist["matrix"]):
+        print(
+            f"{player:<25} {sum(row[:4]) * 100:>5.1f}% {row[n_players - 1] * 100:>5.1f}% "
+            f"{row[n_players + 1] * 100:>5.1f}% {row[n_players + 2] * 100:>6.1f}%"
+        )
+
+    # Batched overround vs per-market bisection
+    print("\n" + "=" * 60)
+    print("BATCHED OVERROUND (Halley, all markets in one solve)")
+    print("=" * 60)
+    import time
+
+    check_rng = np.random.default_rng(RANDOM_SEED)
+    markets = [[float(p), 1.0 - float(p)] for p in ctx.win_prob]
+    markets.append([o["true_probability"] for o in adaptive])
+    for size in check_rng.integers(2, 13, size=2000):
+        raw = check_rng.dirichlet(np.full(size, 0.7))
+        markets.append(list(raw))
+    targets = list(check_rng.uniform(1.02, 1.30, size=len(markets)))
+
+    start = time.perf_counter()
+    batch = apply_power_overround_batch(markets, targets)
+    batch_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bisect = [apply_power_overround(m, t) for m, t in zip(markets, targets)]
+    bisect_time = time.perf_counter() - start
+
+    max_diff = max(abs(a - b) for bm, sm in zip(batch, bisect) for a, b in zip(bm, sm))
+    print(
+        f"Markets: {len(markets):,}  batch: {batch_time * 1000:.1f} ms  "
+        f"bisection: {bisect_time * 1000:.1f} ms"
+    )
+    print(f"Max |batch - bisection|: {max_diff:.2e} (must be < 1e-9)")
+    assert max_diff < 1e-9
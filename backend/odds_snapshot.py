@@ -0,0 +1,173 @@
+"""Odds snapshot service — keeps CPU-bound Elo replay and Monte Carlo off the event loop.
+
+After a result is written, ratings and odds are recomputed in a worker
+process and published as an immutable, versioned OddsSnapshot by swapping
+a single reference. Readers always get the last good snapshot immediately;
+if the match table has moved on, a background refresh is started and the
+old snapshot is served until the new one lands.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from elo_engine import PlayerRating, get_elo_ratings
+from match_data import match_table_version, scheduled_matches
+from odds_engine import (
+    MC_MAX_ITERATIONS,
+    MC_TOLERANCE,
+    MC_VARIANCE_REDUCTION,
+    MatchOddsTable,
+    SimulationContext,
+    build_simulation_context,
+    get_finishing_distribution,
+    get_match_odds_table,
+    get_outright_odds,
+)
+
+
+@dataclass(frozen=True)
+class OddsSnapshot:
+    """Ratings and odds computed from one state of the match table."""
+
+    version: int  # Monotonic per process, bumped on every publish
+    data_version: int  # Match-table state the snapshot was computed from
+    created_at: float  # time.time() at publish
+    ratings: dict[str, PlayerRating]
+    ctx: SimulationContext
+    outright: list[dict]
+    match_odds: MatchOddsTable
+    distribution: dict  # Finishing-position matrix from the outright run
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    def headers(self) -> dict[str, str]:
+        """Response headers exposing snapshot version and age."""
+        return {
+            "X-Odds-Snapshot-Version": str(self.version),
+            "X-Odds-Snapshot-Age": f"{self.age_seconds:.1f}",
+        }
+
+
+def compute_snapshot_payload() -> dict:
+    """Recompute ratings and odds from the database (runs in the worker process)."""
+    data_version = match_table_version()
+    ratings = get_elo_ratings()
+    ctx = build_simulation_context(ratings, scheduled_matches())
+    return {
+        "data_version": data_version,
+        "ratings": ratings,
+        "ctx": ctx,
+        "outright": get_outright_odds(
+            ctx,
+            MC_MAX_ITERATIONS,
+            tolerance=MC_TOLERANCE,
+            variance=MC_VARIANCE_REDUCTION,
+            record_paths=True,  # Kept in the worker for what-if queries
+        ),
+        "match_odds": get_match_odds_table(ctx),
+        "distribution": get_finishing_distribution(ctx, variance=MC_VARIANCE_REDUCTION),
+    }
+
+
+class OddsSnapshotService:
+    """Publishes OddsSnapshots computed in a single worker process."""
+
+    def __init__(self):
+        self._snapshot: OddsSnapshot | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._requested = 0  # Refresh requests issued
+        self._completed = 0  # Requests covered by a published snapshot
+
+    @property
+    def current(self) -> OddsSnapshot | None:
+        return self._snapshot
+
+    @property
+    def refreshing(self) -> bool:
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: never fork a process that is running an event loop and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def run_in_worker(self, fn, *args, **kwargs):
+        """Run a CPU-bound callable in the worker process without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), functools.partial(fn, *args, **kwargs)
+            )
+        except BrokenProcessPool:
+            self._executor = None  # Worker died; start a fresh one next time
+            raise
+
+    async def _refresh_loop(self):
+        # Requests that arrive mid-computation trigger one more pass, so a
+        # published snapshot always covers every write before its request.
+        while self._completed < self._requested:
+            target = self._requested
+            payload = await self.run_in_worker(compute_snapshot_payload)
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            self._snapshot = OddsSnapshot(version=version, created_at=time.time(), **payload)
+            self._completed = target
+
+    def _ensure_refresh_task(self) -> asyncio.Task:
+        if not self.refreshing:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+            self._refresh_task.add_done_callback(_log_refresh_failure)
+        return self._refresh_task
+
+    def request_refresh(self):
+        """Start a background recompute; readers keep the last good snapshot."""
+        self._requested += 1
+        self._ensure_refresh_task()
+
+    async def refresh(self) -> OddsSnapshot:
+        """Recompute and wait for the snapshot that includes all writes so far."""
+        self._requested += 1
+        return await self._wait_for(self._requested)
+
+    async def _wait_for(self, target: int) -> OddsSnapshot:
+        while self._completed < target:
+            await asyncio.shield(self._ensure_refresh_task())
+        return self._snapshot
+
+    async def get(self) -> OddsSnapshot:
+        """Last good snapshot, refreshing in the background if match data changed.
+
+        Only waits when no snapshot has been published yet.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            # Join the startup refresh if one is pending instead of queueing another
+            if self._requested == self._completed:
+                self._requested += 1
+            return await self._wait_for(self._requested)
+        if not self.refreshing and match_table_version() != snapshot.data_version:
+            self.request_refresh()
+        return snapshot
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _log_refresh_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[odds_snapshot] Refresh failed, serving last good snapshot: {task.exception()!r}")
+
+
+odds_snapshots = OddsSnapshotService()
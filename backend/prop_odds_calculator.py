@@ -12,10 +12,14 @@ Generates 7 types of prop markets for each match using Elo-based calibration:
 Odds are calibrated from Elo ratings:
 - Higher-rated players have better 180/checkout probabilities
 - Overround at 108% (matching match odds engine)
+
+Market builders return true probabilities; the overround is applied to
+every market of every requested match in one batched solve
+(odds_engine.apply_power_overround_batch).
 """
 
-from elo_engine import INITIAL_ELO, PlayerRating, expected_score
-from odds_engine import apply_power_overround, prob_to_decimal_odds
+from elo_engine import expected_score
+from odds_engine import SimulationContext, apply_power_overround_batch, prob_to_decimal_odds
 
 TARGET_OVERROUND = 1.08
 
@@ -45,9 +49,21 @@ def _elo_to_skill(elo: float) -> float:
 
 
 def _make_selections(true_probs: list[float], names: list[str]) -> list[dict]:
-    """Apply overround and return [{name, odds}] selections."""
-    implied = apply_power_overround(true_probs, TARGET_OVERROUND)
-    return [{"name": name, "odds": prob_to_decimal_odds(ip)} for name, ip in zip(names, implied)]
+    """Return unpriced [{name, true_probability}] selections (see _price_markets)."""
+    return [{"name": name, "true_probability": p} for name, p in zip(names, true_probs)]
+
+
+def _price_markets(markets: list[dict]) -> list[dict]:
+    """Apply overround to all markets at once, turning selections into [{name, odds}]."""
+    implied_all = apply_power_overround_batch(
+        [[sel["true_probability"] for sel in m["selections"]] for m in markets], TARGET_OVERROUND
+    )
+    for m, implied in zip(markets, implied_all):
+        m["selections"] = [
+            {"name": sel["name"], "odds": prob_to_decimal_odds(ip)}
+            for sel, ip in zip(m["selections"], implied)
+        ]
+    return markets
 
 
 # --- Market Type 1: Total 180s Over/Under ---
@@ -246,23 +262,12 @@ def player_ton_plus_checkout_market(elo: float, player_name: str, opponent_name:
 # --- Aggregate: All prop markets for a match ---
 
 
-def get_all_prop_markets(
-    elo_ratings: dict[str, PlayerRating],
-    match: dict,
-) -> list[dict]:
-    """Generate all 7 prop market types for a single match.
-
-    Args:
-        elo_ratings: dict of player name -> PlayerRating
-        match: dict with player1, player2, round, match_id
-
-    Returns:
-        List of market dicts, each with: name, description, selections
-    """
+def _match_prop_markets(ctx: SimulationContext, match: dict) -> list[dict]:
+    """Unpriced prop markets for one match."""
     p1 = match["player1"]
     p2 = match["player2"]
-    elo1 = elo_ratings[p1].elo if p1 in elo_ratings else INITIAL_ELO
-    elo2 = elo_ratings[p2].elo if p2 in elo_ratings else INITIAL_ELO
+    elo1 = ctx.elo_of(p1)
+    elo2 = ctx.elo_of(p2)
 
     sn1 = short_name(p1)
     sn2 = short_name(p2)
@@ -285,3 +290,29 @@ def get_all_prop_markets(
         m["match_id"] = match["match_id"]
 
     return markets
+
+
+def get_all_prop_markets(
+    ctx: SimulationContext,
+    match: dict,
+) -> list[dict]:
+    """Generate all 7 prop market types for a single match.
+
+    Args:
+        ctx: compiled rating state (see odds_engine.build_simulation_context)
+        match: dict with player1, player2, round, match_id
+
+    Returns:
+        List of market dicts, each with: name, description, selections
+    """
+    return _price_markets(_match_prop_markets(ctx, match))
+
+
+def get_schedule_prop_markets(ctx: SimulationContext, matches: list[dict]) -> list[list[dict]]:
+    """Prop markets for many matches, priced in a single overround solve.
+
+    Returns one list of market dicts per match, in input order.
+    """
+    per_match = [_match_prop_markets(ctx, match) for match in matches]
+    _price_markets([m for markets in per_match for m in markets])
+    return per_match
@@ -0,0 +1,58 @@
+"""Round-robin ranking kernel shared by live standings and the simulators.
+
+Standings order: wins desc, then leg difference desc, then legs won desc.
+Players still level after all three keep player-index order (ALL_PLAYERS,
+alphabetical), the same result as a stable sort over ALL_PLAYERS.
+
+All keys plus the index tiebreak are packed into one int64 score per player,
+so ranking a whole batch of tables is a single argsort (full order) or
+argpartition (top k) over integers instead of a multi-key sort.
+get_standings and the Monte Carlo engines all rank through this module, so
+live and simulated tiebreaks cannot diverge.
+"""
+
+import numpy as np
+
+
+def pack_scores(wins: np.ndarray, leg_diff: np.ndarray, legs_for: np.ndarray) -> np.ndarray:
+    """Pack (wins, leg_diff, legs_for, -player index) into one int64 per player.
+
+    Args:
+        wins, leg_diff, legs_for: (..., P) integer arrays, last axis = player
+
+    Returns:
+        (..., P) scores; higher score ranks higher, and scores within a table
+        are unique.
+    """
+    wins = np.asarray(wins, dtype=np.int64)
+    leg_diff = np.asarray(leg_diff, dtype=np.int64)
+    legs_for = np.asarray(legs_for, dtype=np.int64)
+    n_players = wins.shape[-1]
+
+    # Shift every key to >= 0 and give it a radix wide enough for the batch
+    score = np.zeros(wins.shape, dtype=np.int64)
+    for key in (wins, leg_diff, legs_for):
+        low = key.min(initial=0)
+        span = int(key.max(initial=0)) - int(low) + 1
+        score = score * span + (key - low)
+    index_rank = np.arange(n_players - 1, -1, -1, dtype=np.int64)
+    return score * n_players + index_rank
+
+
+def rank_order(scores: np.ndarray) -> np.ndarray:
+    """Full standings order per table: (..., P) player indices, best first."""
+    return np.argsort(-scores, axis=-1)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Seeded top k per table: (n, k) player indices, best first.
+
+    For wide tables, partial selection (argpartition) picks the k best of
+    every row and only those k are sorted. For narrow ones (P <= 4k, e.g.
+    top 8 of 20) one full argsort over the packed integers is faster.
+    """
+    if scores.shape[-1] <= 4 * k:
+        return rank_order(scores)[..., :k]
+    best = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    best_scores = np.take_along_axis(scores, best, axis=-1)
+    return np.take_along_axis(best, np.argsort(-best_scores, axis=-1), axis=-1)
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from backtest import get_backtest_report
 from database import (
     Bet,
     BetStatus,
@@ -19,15 +20,36 @@ from deps import (
     log_activity,
     require_admin,
 )
-from elo_engine import get_elo_ratings, get_sorted_ratings
-from fastapi import APIRouter, Depends, HTTPException
-from match_data import get_scheduled_matches, invalidate_cache, write_match_result
-from odds_engine import get_outright_odds
+from elo_engine import (
+    check_rating_state,
+    get_elo_ratings,
+    get_sorted_ratings,
+    rebuild_rating_state,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from match_data import (
+    get_scheduled_matches,
+    scheduled_matches,
+    write_match_result,
+)
+from odds_engine import (
+    MC_MAX_ITERATIONS,
+    MC_TOLERANCE,
+    MC_VARIANCE_REDUCTION,
+    RANDOM_SEED,
+    build_simulation_context,
+    get_knockout_matrix,
+    get_outright_odds,
+)
+from odds_snapshot import OddsSnapshot, odds_snapshots
 from prop_odds_calculator import get_all_prop_markets
 from schemas import (
+    BacktestReportResponse,
     EnterResultRequest,
     EnterResultResponse,
     GeneratePropMarketsRequest,
+    KnockoutMatrixResponse,
     LiabilityMarket,
     LiabilitySelection,
     MarketResponse,
@@ -35,10 +57,17 @@ from schemas import (
     OutrightOddsEntry,
     PlayerRatingResponse,
     PropMarketPreview,
+    RatingStateCheckResponse,
     ScheduledMatchResponse,
     UpdateMatchStats,
     WhatsAppLogResponse,
 )
+from simulation_stream import (
+    STREAM_REPORT_EVERY,
+    SimulationRun,
+    simulation_runs,
+    stream_outright,
+)
 from sqlalchemy.orm import Session
 from whatsapp_client import whatsapp_client
 
@@ -95,10 +124,41 @@ async def admin_enter_result(
 
     _settle_prop_markets(db, data)
 
-    ratings = get_elo_ratings()
-    sorted_ratings = get_sorted_ratings(ratings)
+    # Elo replay + Monte Carlo run in the snapshot worker process; awaiting it
+    # keeps the event loop free for every other request.
+    snapshot = await odds_snapshots.refresh()
+    rating_list = _rating_entries(snapshot.ratings)
+    odds_list = _outright_entries(snapshot.outright)
+
+    _refresh_market_elo_odds(db, snapshot)
+
+    await log_activity(
+        db,
+        "match_result",
+        f"Match M{data.match_id} result: {data.winner} wins ({data.score1}-{data.score2})",
+        user_id=user.id,
+        data={
+            "match_id": data.match_id,
+            "winner": data.winner,
+            "score": f"{data.score1}-{data.score2}",
+        },
+    )
+
+    return EnterResultResponse(
+        message="Result entered. Elo ratings and odds updated.",
+        match_id=data.match_id,
+        winner=data.winner,
+        score=f"{data.score1}-{data.score2}",
+        updated_ratings=rating_list,
+        updated_outright_odds=odds_list,
+        snapshot_version=snapshot.version,
+    )
 
-    rating_list = [
+
+def _rating_entries(ratings: dict) -> list[PlayerRatingResponse]:
+    """Convert PlayerRatings to response entries sorted by Elo (active players only)."""
+    sorted_ratings = get_sorted_ratings(ratings)
+    return [
         PlayerRatingResponse(
             rank=i,
             player=name,
@@ -112,55 +172,34 @@ async def admin_enter_result(
         if ratings[name].games_played > 0
     ]
 
-    sched = get_scheduled_matches()
-    outright = get_outright_odds(ratings, sched)
 
-    odds_list = [
+def _outright_entries(outright: list[dict]) -> list[OutrightOddsEntry]:
+    """Convert get_outright_odds() dicts to response entries."""
+    return [
         OutrightOddsEntry(
             player=o["player"],
             true_probability=o["true_probability"],
             implied_probability=o["implied_probability"],
             odds=o["odds"],
             top8_pct=o["top8_pct"],
+            iterations=o["iterations"],
+            std_error=o["std_error"],
+            ci_low=o["ci_low"],
+            ci_high=o["ci_high"],
         )
         for o in outright
     ]
 
-    _refresh_market_elo_odds(db, ratings, sched)
-
-    await log_activity(
-        db,
-        "match_result",
-        f"Match M{data.match_id} result: {data.winner} wins ({data.score1}-{data.score2})",
-        user_id=user.id,
-        data={
-            "match_id": data.match_id,
-            "winner": data.winner,
-            "score": f"{data.score1}-{data.score2}",
-        },
-    )
-
-    return EnterResultResponse(
-        message="Result entered. Elo ratings and odds updated.",
-        match_id=data.match_id,
-        winner=data.winner,
-        score=f"{data.score1}-{data.score2}",
-        updated_ratings=rating_list,
-        updated_outright_odds=odds_list,
-    )
-
 
-def _refresh_market_elo_odds(db: Session, ratings: dict, sched: list[dict]):
-    """Update Selection.odds for open markets with fresh Elo-derived odds."""
-    from odds_engine import get_match_odds as compute_match_odds
+def _refresh_market_elo_odds(db: Session, snapshot: OddsSnapshot):
+    """Update Selection.odds for open markets with fresh Elo-derived odds.
 
-    outright = get_outright_odds(ratings, sched)
-    outright_odds_map = {o["player"]: o["odds"] for o in outright}
+    Uses the odds already computed for the snapshot, so the enter-result
+    flow simulates once.
+    """
+    outright_odds_map = {o["player"]: o["odds"] for o in snapshot.outright}
 
-    match_odds_list = compute_match_odds(ratings, sched)
-    match_odds_map = {}
-    for mo in match_odds_list:
-        match_odds_map[(mo["player1"], mo["player2"])] = (mo["odds1"], mo["odds2"])
+    match_odds_map = snapshot.match_odds.odds_by_pair()
 
     outright_markets = (
         db.query(Market)
@@ -300,41 +339,130 @@ def _settle_prop_markets(db: Session, data):
 
 
 @router.get("/admin/current-ratings", response_model=list[PlayerRatingResponse])
-async def admin_current_ratings(user: User = Depends(require_admin)):
-    """Get current Elo ratings for all players."""
-    ratings = get_elo_ratings()
-    sorted_ratings = get_sorted_ratings(ratings)
-    return [
-        PlayerRatingResponse(
-            rank=i,
-            player=name,
-            elo=round(elo, 1),
-            wins=ratings[name].wins,
-            losses=ratings[name].losses,
-            draws=ratings[name].draws,
-            games_played=ratings[name].games_played,
-        )
-        for i, (name, elo) in enumerate(sorted_ratings, 1)
-        if ratings[name].games_played > 0
-    ]
+async def admin_current_ratings(response: Response, user: User = Depends(require_admin)):
+    """Get current Elo ratings for all players (from the latest odds snapshot)."""
+    snapshot = await odds_snapshots.get()
+    response.headers.update(snapshot.headers())
+    return _rating_entries(snapshot.ratings)
+
+
+@router.get("/admin/rating-state/check", response_model=RatingStateCheckResponse)
+async def admin_check_rating_state(
+    db: Session = Depends(get_db), user: User = Depends(require_admin)
+):
+    """Compare the persisted Elo state with a full replay of completed matches (read-only)."""
+    mismatches = check_rating_state(db)
+    return {"consistent": not mismatches, "repaired": False, "mismatches": mismatches}
+
+
+@router.post("/admin/rating-state/repair", response_model=RatingStateCheckResponse)
+async def admin_repair_rating_state(
+    db: Session = Depends(get_db), user: User = Depends(require_admin)
+):
+    """Check the persisted Elo state and, if inconsistent, rebuild it from a replay.
+
+    A repair also refreshes the odds snapshot. mismatches lists what was
+    wrong before the rebuild.
+    """
+    mismatches = check_rating_state(db)
+    if mismatches:
+        rebuild_rating_state(db)
+        db.commit()
+        odds_snapshots.request_refresh()
+    return {"consistent": not mismatches, "repaired": bool(mismatches), "mismatches": mismatches}
+
+
+@router.get("/admin/backtest", response_model=BacktestReportResponse)
+async def admin_backtest(user: User = Depends(require_admin)):
+    """Brier score, log loss and calibration of the Elo, knockout and exact-score models.
+
+    Computed over all completed matches in the odds snapshot worker (the
+    replay would block the event loop) and cached there until the next
+    result is entered.
+    """
+    return await odds_snapshots.run_in_worker(get_backtest_report)
 
 
 @router.get("/admin/current-odds", response_model=list[OutrightOddsEntry])
-async def admin_current_odds(user: User = Depends(require_admin)):
-    """Get current outright tournament winner odds (Monte Carlo)."""
-    ratings = get_elo_ratings()
-    sched = get_scheduled_matches()
-    outright = get_outright_odds(ratings, sched)
-    return [
-        OutrightOddsEntry(
-            player=o["player"],
-            true_probability=o["true_probability"],
-            implied_probability=o["implied_probability"],
-            odds=o["odds"],
-            top8_pct=o["top8_pct"],
-        )
-        for o in outright
-    ]
+async def admin_current_odds(
+    response: Response,
+    tolerance: float = Query(MC_TOLERANCE, gt=0, le=0.05),
+    max_iterations: int = Query(MC_MAX_ITERATIONS, ge=1000, le=2_000_000),
+    user: User = Depends(require_admin),
+):
+    """Get current outright tournament winner odds (adaptive Monte Carlo).
+
+    Simulates until every quoted player's standard error is <= tolerance,
+    up to max_iterations. Each entry reports iterations used and a 95% CI.
+    Default settings are served from the latest odds snapshot; custom ones
+    are computed in the snapshot worker process from the same ratings.
+    """
+    snapshot = await odds_snapshots.get()
+    response.headers.update(snapshot.headers())
+
+    if tolerance == MC_TOLERANCE and max_iterations == MC_MAX_ITERATIONS:
+        return _outright_entries(snapshot.outright)
+
+    outright = await odds_snapshots.run_in_worker(
+        get_outright_odds,
+        snapshot.ctx,
+        max_iterations,
+        RANDOM_SEED,
+        tolerance=tolerance,
+        variance=MC_VARIANCE_REDUCTION,
+    )
+    return _outright_entries(outright)
+
+
+@router.get("/admin/knockout-matrix", response_model=KnockoutMatrixResponse)
+async def admin_knockout_matrix(
+    response: Response, stage: str = "QF", user: User = Depends(require_admin)
+):
+    """Head-to-head knockout win probabilities for a stage (QF, SF or Final).
+
+    The same precomputed matrices the simulation and QF markets look up,
+    for every pair with the row player as higher or lower seed.
+    """
+    snapshot = await odds_snapshots.get()
+    try:
+        grid = get_knockout_matrix(snapshot.ctx, stage)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers.update(snapshot.headers())
+    return grid
+
+
+@router.get("/admin/simulations/stream")
+async def admin_stream_simulation(
+    tolerance: float = Query(MC_TOLERANCE, gt=0, le=0.05),
+    max_iterations: int = Query(MC_MAX_ITERATIONS, ge=1000, le=2_000_000),
+    report_every: int = Query(STREAM_REPORT_EVERY, ge=1000, le=1_000_000),
+    user: User = Depends(require_admin),
+):
+    """Stream interim outright odds as Server-Sent Events.
+
+    Emits a progress event with odds and 95% CIs every report_every
+    iterations until the tolerance is met, max_iterations is reached, or the
+    run is cancelled via POST /admin/simulations/{run_id}/cancel (the run id
+    is in the start event and the X-Simulation-Run header).
+    """
+    snapshot = await odds_snapshots.get()
+    run = SimulationRun()  # Registered by stream_outright once streaming starts
+    return StreamingResponse(
+        stream_outright(
+            snapshot.ctx, run, max_iterations, RANDOM_SEED, tolerance, report_every=report_every
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Simulation-Run": run.run_id, **snapshot.headers()},
+    )
+
+
+@router.post("/admin/simulations/{run_id}/cancel")
+async def admin_cancel_simulation(run_id: str, user: User = Depends(require_admin)):
+    """Cancel a streamed simulation; it stops after the chunk in progress."""
+    if not simulation_runs.cancel(run_id):
+        raise HTTPException(status_code=404, detail="Simulation run not found or already finished")
+    return {"message": "Simulation cancelled", "run_id": run_id}
 
 
 @router.get("/admin/liability", response_model=list[LiabilityMarket])
@@ -459,8 +587,7 @@ async def preview_prop_markets(match_id: int):
     if match_row.status == "Completed":
         raise HTTPException(status_code=400, detail="Match already completed")
 
-    invalidate_cache()
-    ratings = get_elo_ratings()
+    ctx = build_simulation_context(get_elo_ratings(), scheduled_matches())
 
     match_dict = {
         "player1": match_row.player1,
@@ -469,7 +596,7 @@ async def preview_prop_markets(match_id: int):
         "match_id": match_row.match_id,
     }
 
-    prop_markets = get_all_prop_markets(ratings, match_dict)
+    prop_markets = get_all_prop_markets(ctx, match_dict)
     return prop_markets
 
 
@@ -488,8 +615,7 @@ async def generate_prop_markets(
     if match_row.status == "Completed":
         raise HTTPException(status_code=400, detail="Match already completed")
 
-    invalidate_cache()
-    ratings = get_elo_ratings()
+    ctx = build_simulation_context(get_elo_ratings(), scheduled_matches())
 
     match_dict = {
         "player1": match_row.player1,
@@ -498,7 +624,7 @@ async def generate_prop_markets(
         "match_id": match_row.match_id,
     }
 
-    prop_markets = get_all_prop_markets(ratings, match_dict)
+    prop_markets = get_all_prop_markets(ctx, match_dict)
 
     created_ids = []
     for pm in prop_markets:
@@ -1,22 +1,59 @@
-"""Tournament routes — standings, ratings, results, upcoming matches."""
+"""Tournament routes — standings, ratings, results, upcoming matches, simulated odds."""
 
-from elo_engine import get_elo_ratings, get_sorted_ratings
-from fastapi import APIRouter
-from match_data import completed_matches, get_scheduled_matches, get_standings, invalidate_cache
+from database import get_db
+from downsample import lttb
+from elo_engine import get_elo_ratings, get_sorted_ratings, process_matches, ratings_as_of
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from match_data import (
+    completed_matches,
+    get_scheduled_matches,
+    get_standings,
+    match_table_version,
+)
+from odds_engine import MC_VARIANCE_REDUCTION, get_what_if_odds
+from odds_snapshot import odds_snapshots
 from schemas import (
     CompletedMatchResponse,
+    FinishingDistributionResponse,
     PlayerRatingResponse,
+    RatingHistoryResponse,
     ScheduledMatchResponse,
     StandingEntry,
+    WhatIfResponse,
 )
+from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/api/tournament", tags=["tournament"])
 
+RATING_HISTORY_POINTS = 50  # Default per-player point budget for rating charts
+
+# Responses and rating history derived from the match table, valid for one
+# match-table version. Every read checks the version (one primary-key
+# lookup), so a result written by any worker process is picked up by the
+# next request here.
+_response_cache: dict[str, list] = {}
+_response_cache_version: int | None = None
+
+
+def _cached(key: str, build):
+    """Response for key, rebuilt only after the match table has changed."""
+    global _response_cache_version
+    version = match_table_version()
+    if version != _response_cache_version:
+        _response_cache.clear()
+        _response_cache_version = version
+    if key not in _response_cache:
+        _response_cache[key] = build()
+    return _response_cache[key]
+
 
 @router.get("/standings", response_model=list[StandingEntry])
 async def tournament_standings():
     """Get current tournament standings (W-L-D, legs, leg diff)."""
-    invalidate_cache()
+    return _cached("standings", _build_standings)
+
+
+def _build_standings() -> list[StandingEntry]:
     standings = get_standings()
     return [
         StandingEntry(
@@ -35,10 +72,21 @@ async def tournament_standings():
 
 
 @router.get("/ratings", response_model=list[PlayerRatingResponse])
-async def tournament_ratings():
-    """Get current Elo ratings for all active players (public)."""
-    invalidate_cache()
-    ratings = get_elo_ratings()
+async def tournament_ratings(
+    as_of_match: int | None = Query(None, ge=0, description="Ratings after this match_id"),
+    db: Session = Depends(get_db),
+):
+    """Get Elo ratings for all active players (public).
+
+    Current ratings by default; with as_of_match, ratings after every
+    completed match up to that match_id (nearest checkpoint + short replay).
+    """
+    if as_of_match is None:
+        return _cached("ratings", lambda: _rating_entries(get_elo_ratings()))
+    return _rating_entries(ratings_as_of(db, as_of_match))
+
+
+def _rating_entries(ratings: dict) -> list[PlayerRatingResponse]:
     sorted_ratings = get_sorted_ratings(ratings)
     return [
         PlayerRatingResponse(
@@ -55,10 +103,58 @@ async def tournament_ratings():
     ]
 
 
+@router.get("/ratings/history", response_model=RatingHistoryResponse)
+async def tournament_rating_history(
+    request: Request,
+    response: Response,
+    points: int = Query(RATING_HISTORY_POINTS, ge=3, le=1000, description="Max points per player"),
+):
+    """Elo trajectory per player, downsampled (LTTB) to at most `points` points each.
+
+    Built once per match-table version. The ETag changes with the version,
+    so chart clients can revalidate with If-None-Match and get a 304.
+    """
+    history = _cached(f"ratings_history:{points}", lambda: _downsampled_history(points))
+    etag = f'"{history["data_version"]}-{points}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return history
+
+
+def _rating_trajectories() -> list[tuple[str, list[int], list[float]]]:
+    """Full (player, match_ids, elos) series from one replay, best-rated first."""
+    ratings = process_matches(completed_matches())
+    return [
+        (name, r.history.player_match_ids(name).tolist(), r.history.player_elos(name).tolist())
+        for name, _ in get_sorted_ratings(ratings)
+        if (r := ratings[name]).games_played > 0
+    ]
+
+
+def _downsampled_history(points: int) -> dict:
+    trajectories = _cached("ratings_history", _rating_trajectories)
+    players = []
+    for name, match_ids, elos in trajectories:
+        keep = lttb(match_ids, elos, points)
+        players.append(
+            {
+                "player": name,
+                "games_played": len(elos),
+                "match_ids": [match_ids[i] for i in keep],
+                "elos": [round(elos[i], 1) for i in keep],
+            }
+        )
+    return {"data_version": _response_cache_version, "max_points": points, "players": players}
+
+
 @router.get("/results", response_model=list[CompletedMatchResponse])
 async def tournament_results():
     """Get all completed match results, most recent first."""
-    invalidate_cache()
+    return _cached("results", _build_results)
+
+
+def _build_results() -> list[CompletedMatchResponse]:
     matches = completed_matches()
     return [
         CompletedMatchResponse(
@@ -78,7 +174,10 @@ async def tournament_results():
 @router.get("/upcoming", response_model=list[ScheduledMatchResponse])
 async def tournament_upcoming():
     """Get all upcoming scheduled matches, ordered by round and match_id."""
-    invalidate_cache()
+    return _cached("upcoming", _build_upcoming)
+
+
+def _build_upcoming() -> list[ScheduledMatchResponse]:
     sched = get_scheduled_matches()
     return [
         ScheduledMatchResponse(
@@ -89,3 +188,43 @@ async def tournament_upcoming():
         )
         for m in sched
     ]
+
+
+@router.get("/finishing-distribution", response_model=FinishingDistributionResponse)
+async def tournament_finishing_distribution(response: Response):
+    """Round-robin finishing-position and QF/SF/Final/title probabilities per player.
+
+    Compact matrix (players x columns) from the same simulation run as the
+    published outright odds.
+    """
+    snapshot = await odds_snapshots.get()
+    response.headers.update(snapshot.headers())
+    return snapshot.distribution
+
+
+@router.get("/what-if", response_model=WhatIfResponse)
+async def tournament_what_if(
+    match_id: list[int] = Query([], description="Scheduled match id (repeatable)"),
+    winner: list[str] = Query([], description="Winner of the match at the same position"),
+):
+    """Conditional outright odds if the given scheduled matches go a certain way.
+
+    e.g. /what-if?match_id=143&winner=X&match_id=150&winner=Y. Answered from
+    the paths stored by the current odds snapshot's simulation (no rerun);
+    sufficient_paths is false when too few paths satisfy every condition.
+    """
+    if not match_id or len(match_id) != len(winner):
+        raise HTTPException(
+            status_code=400, detail="Give at least one match_id, and one winner per match_id"
+        )
+
+    snapshot = await odds_snapshots.get()
+    try:
+        return await odds_snapshots.run_in_worker(
+            get_what_if_odds,
+            snapshot.ctx,
+            list(zip(match_id, winner)),
+            variance=MC_VARIANCE_REDUCTION,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -264,12 +264,29 @@ class PlayerRatingResponse(BaseModel):
     games_played: int
 
 
+class RatingTrajectory(BaseModel):
+    player: str
+    games_played: int  # Points before downsampling
+    match_ids: list[int]  # Chart x: match after which elos[i] applied
+    elos: list[float]
+
+
+class RatingHistoryResponse(BaseModel):
+    data_version: int
+    max_points: int  # Per-player point budget the series were downsampled to
+    players: list[RatingTrajectory]  # Ordered by current rating
+
+
 class OutrightOddsEntry(BaseModel):
     player: str
     true_probability: float
     implied_probability: float
     odds: float
     top8_pct: float
+    iterations: int  # Monte Carlo iterations actually run (adaptive precision)
+    std_error: float
+    ci_low: float  # 95% confidence interval on true_probability
+    ci_high: float
 
 
 class EnterResultResponse(BaseModel):
@@ -279,6 +296,82 @@ class EnterResultResponse(BaseModel):
     score: str
     updated_ratings: list[PlayerRatingResponse]
     updated_outright_odds: list[OutrightOddsEntry]
+    snapshot_version: int  # Odds snapshot the updated ratings/odds come from
+
+
+class WhatIfCondition(BaseModel):
+    match_id: int
+    player1: str
+    player2: str
+    winner: str
+
+
+class WhatIfOddsEntry(BaseModel):
+    player: str
+    true_probability: float  # Title probability given the conditions
+    baseline_probability: float  # Unconditional, from the same paths
+    top8_pct: float
+    std_error: float
+
+
+class WhatIfResponse(BaseModel):
+    conditions: list[WhatIfCondition]
+    paths_total: int  # Simulated paths available
+    paths_matched: int  # Paths consistent with every condition
+    sufficient_paths: bool  # False when too few paths remain to trust the odds
+    odds: list[WhatIfOddsEntry]
+
+
+class FinishingDistributionResponse(BaseModel):
+    players: list[str]
+    columns: list[str]  # pos_1..pos_N, reach_qf, reach_sf, reach_final, title
+    iterations: int
+    matrix: list[list[float]]  # matrix[i][j]: probability for players[i], columns[j]
+
+
+class RatingStateCheckResponse(BaseModel):
+    consistent: bool
+    repaired: bool
+    mismatches: list[dict]  # {player, stored, replayed} per inconsistent player
+
+
+class KnockoutMatrixResponse(BaseModel):
+    stage: str  # QF, SF or Final
+    players: list[str]
+    elo: list[float]
+    higher_seed: list[list[float]]  # [i][j]: P(players[i] beats players[j]), i higher seed
+    lower_seed: list[list[float]]  # [i][j]: same with players[i] as lower seed
+
+
+class CalibrationBin(BaseModel):
+    low: float
+    high: float
+    count: int
+    predicted: float  # Mean forecast probability in the bin
+    observed: float  # Fraction of those forecasts that came true
+
+
+class BinaryForecastScore(BaseModel):
+    n: int
+    brier: float
+    log_loss: float
+    accuracy: float
+    calibration: list[CalibrationBin]
+
+
+class MultiClassForecastScore(BaseModel):
+    n: int
+    brier: float
+    log_loss: float
+    accuracy: float  # Share of matches where the most likely outcome happened
+
+
+class BacktestReportResponse(BaseModel):
+    data_version: int
+    completed_matches: int
+    elo: BinaryForecastScore
+    knockout: BinaryForecastScore
+    exact_score: MultiClassForecastScore
 
 
 class LiabilitySelection(BaseModel):
@@ -8,8 +8,16 @@ with 10% house cut.
 from database import BettingType, Market, Selection, SessionLocal, User, create_tables
 from elo_engine import get_elo_ratings, get_sorted_ratings
 from match_data import scheduled_matches
-from odds_engine import get_match_odds, get_outright_odds, get_quarterfinal_matchup_odds
-from prop_odds_calculator import get_all_prop_markets, short_name
+from odds_engine import (
+    MC_MAX_ITERATIONS,
+    MC_TOLERANCE,
+    MC_VARIANCE_REDUCTION,
+    build_simulation_context,
+    get_match_odds_table,
+    get_outright_odds,
+    get_quarterfinal_matchup_odds,
+)
+from prop_odds_calculator import get_schedule_prop_markets, short_name
 
 
 def seed_database():
@@ -27,19 +35,22 @@ def seed_database():
         print("Computing Elo ratings...")
         ratings = get_elo_ratings()
         sched = scheduled_matches()
+        ctx = build_simulation_context(ratings, sched)
 
         print("Running Monte Carlo simulation for outright odds...")
-        outright = get_outright_odds(ratings, sched)
+        outright = get_outright_odds(
+            ctx, MC_MAX_ITERATIONS, tolerance=MC_TOLERANCE, variance=MC_VARIANCE_REDUCTION
+        )
 
         print("Computing match odds...")
-        match_odds_list = get_match_odds(ratings, sched)
+        match_odds = get_match_odds_table(ctx)
 
         # Get current top 8 for QF bracket
         sorted_ratings = get_sorted_ratings(ratings)
         current_top8 = [name for name, _ in sorted_ratings[:8]]
 
         print("Computing quarterfinal odds...")
-        qf_odds = get_quarterfinal_matchup_odds(ratings, current_top8)
+        qf_odds = get_quarterfinal_matchup_odds(ctx, current_top8)
 
         # --- Create admin user ---
         admin = User(
@@ -116,7 +127,7 @@ def seed_database():
             print(f"Created market: {market.name} (PARIMUTUEL)")
 
         # --- 3. Upcoming Round-Robin Match Markets (next 10 scheduled) ---
-        for mo in match_odds_list[:10]:
+        for mo in match_odds.to_dicts(limit=10):
             market = Market(
                 name=f"R{mo['round']} M{mo['match_id']}: "
                 f"{short_name(mo['player1'])} vs {short_name(mo['player2'])}",
@@ -153,8 +164,7 @@ def seed_database():
         print("\nGenerating prop markets...")
         prop_count = 0
         prop_sel_count = 0
-        for match_dict in sched[:5]:
-            prop_markets = get_all_prop_markets(ratings, match_dict)
+        for match_dict, prop_markets in zip(sched[:5], get_schedule_prop_markets(ctx, sched[:5])):
             for pm in prop_markets:
                 prop_market = Market(
                     name=pm["name"],
@@ -192,8 +202,8 @@ def seed_database():
         print(f"  1 Outright (Tournament Winner) — {len(outright)} selections")
         print("  4 Quarterfinal matches — 8 selections")
         print(
-            f"  {min(10, len(match_odds_list))} Round-robin matches — "
-            f"{min(10, len(match_odds_list)) * 2} selections"
+            f"  {min(10, len(match_odds))} Round-robin matches — "
+            f"{min(10, len(match_odds)) * 2} selections"
         )
         print(f"  {prop_count} Prop markets — {prop_sel_count} selections")
 
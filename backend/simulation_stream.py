@@ -0,0 +1,176 @@
+"""Streaming outright simulations — interim estimates as Server-Sent Events.
+
+A streamed run is the same seeded simulation as get_outright_odds, driven a
+few seed blocks at a time in the odds snapshot worker process. After every
+chunk the running totals are priced and sent to the client, so usable odds
+(with confidence intervals) arrive within a fraction of a second and keep
+tightening. Runs can be cancelled by id from any worker process (the
+cancel flag lives in the simulation_runs table and is checked between
+chunks); a client disconnect also stops the run.
+
+Events (text/event-stream):
+    start:    {run_id, max_iterations, report_every}
+    progress: {run_id, iterations, converged, odds}
+    done:     {run_id, status, iterations}   status: complete | converged | cancelled
+"""
+
+import json
+import secrets
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import monte_carlo
+from database import SessionLocal, StreamedSimulation
+from odds_engine import (
+    MC_VARIANCE_REDUCTION,
+    OUTRIGHT_MIN_PROBABILITY,
+    SimulationContext,
+    price_outright,
+)
+from odds_snapshot import odds_snapshots
+
+STREAM_REPORT_EVERY = 16_384  # Default iterations between progress events
+STALE_RUN_AGE = timedelta(days=1)  # Rows older than this were left by a dead worker
+
+
+@dataclass
+class SimulationRun:
+    run_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    cancelled: bool = False  # Set once a cancel has been seen
+
+
+class SimulationRunRegistry:
+    """Tracks streamed runs in flight so they can be cancelled by id.
+
+    Runs are rows in simulation_runs rather than process-local state: with
+    several uvicorn workers, the cancel request can land on a different
+    worker than the one streaming the run. stream_outright registers its
+    run when it starts and removes it when it ends, so a response that is
+    never streamed (client gone before the first chunk) leaves no row.
+    """
+
+    def start(self, run: SimulationRun):
+        db = SessionLocal()
+        try:
+            db.query(StreamedSimulation).filter(
+                StreamedSimulation.created_at < datetime.utcnow() - STALE_RUN_AGE
+            ).delete(synchronize_session=False)
+            db.add(StreamedSimulation(run_id=run.run_id))
+            db.commit()
+        finally:
+            db.close()
+
+    def cancel(self, run_id: str) -> bool:
+        """Flag a run to stop after its current chunk. False if unknown."""
+        db = SessionLocal()
+        try:
+            updated = (
+                db.query(StreamedSimulation)
+                .filter(StreamedSimulation.run_id == run_id)
+                .update({StreamedSimulation.cancelled: True}, synchronize_session=False)
+            )
+            db.commit()
+            return updated > 0
+        finally:
+            db.close()
+
+    def is_cancelled(self, run: SimulationRun) -> bool:
+        """Whether a cancel for run has reached any worker (one primary-key read)."""
+        if not run.cancelled:
+            db = SessionLocal()
+            try:
+                run.cancelled = bool(
+                    db.query(StreamedSimulation.cancelled)
+                    .filter(StreamedSimulation.run_id == run.run_id)
+                    .scalar()
+                )
+            finally:
+                db.close()
+        return run.cancelled
+
+    def finish(self, run_id: str):
+        db = SessionLocal()
+        try:
+            db.query(StreamedSimulation).filter(StreamedSimulation.run_id == run_id).delete(
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+simulation_runs = SimulationRunRegistry()
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_outright(
+    ctx: SimulationContext,
+    run: SimulationRun,
+    iterations: int,
+    seed: int,
+    tolerance: float | None,
+    report_every: int = STREAM_REPORT_EVERY,
+    variance: monte_carlo.VarianceReduction = MC_VARIANCE_REDUCTION,
+) -> AsyncIterator[str]:
+    """Yield SSE frames with interim outright odds until done, converged or cancelled.
+
+    Estimates after k blocks are exactly those of a k-block
+    simulate_outright run with the same seed and options (by default the
+    published market's variance reduction).
+    """
+    blocks_per_report = max(1, -(-report_every // monte_carlo.SEED_BLOCK))
+    total_blocks = monte_carlo.block_count(iterations)
+    result = monte_carlo.SimulationResult.empty(len(ctx.players))
+    status = "complete"
+
+    simulation_runs.start(run)
+    try:
+        yield _sse(
+            "start",
+            {
+                "run_id": run.run_id,
+                "max_iterations": iterations,
+                "report_every": blocks_per_report * monte_carlo.SEED_BLOCK,
+            },
+        )
+        for start in range(0, total_blocks, blocks_per_report):
+            if simulation_runs.is_cancelled(run):
+                status = "cancelled"
+                break
+            partials = await odds_snapshots.run_in_worker(
+                monte_carlo.run_blocks,
+                ctx,
+                iterations,
+                seed,
+                start,
+                min(start + blocks_per_report, total_blocks),
+                variance,
+            )
+            for partial in partials:
+                result.add(partial)
+
+            converged = tolerance is not None and result.converged(
+                tolerance, OUTRIGHT_MIN_PROBABILITY
+            )
+            yield _sse(
+                "progress",
+                {
+                    "run_id": run.run_id,
+                    "iterations": result.iterations,
+                    "converged": converged,
+                    "odds": price_outright(ctx, result),
+                },
+            )
+            if converged:
+                status = "converged"
+                break
+
+        yield _sse(
+            "done", {"run_id": run.run_id, "status": status, "iterations": result.iterations}
+        )
+    finally:
+        simulation_runs.finish(run.run_id)
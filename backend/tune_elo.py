@@ -0,0 +1,361 @@
+"""Hyperparameter sweep for the Elo model.
+
+Evaluates many parameter sets (K_BASE, the games-played decay, phase
+weights and margin-of-victory multipliers) against the completed match
+history and ranks them by Brier score, log loss or accuracy.
+
+The replay is vectorized across configurations: ratings are a
+(configs, players) array, so every configuration advances through the
+match list in lockstep and each match costs a handful of array operations
+however many configurations there are. Configurations are split into
+chunks across worker processes.
+
+Predictions are scored the same way as elo_engine's backtest: before each
+decisive match where both players have BACKTEST_MIN_GAMES games, using the
+pre-match expected score for player 1. The current constants are always
+included as the "current" row, and --check verifies that row against
+elo_engine's scalar replay.
+
+Usage:
+    python tune_elo.py --samples 500
+    python tune_elo.py --grid k_base=24,32,40 --grid decay_games=20,30,40
+    python tune_elo.py --samples 2000 --workers 4 --rank-by brier --top 20 --check
+"""
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from elo_engine import (
+    BACKTEST_MIN_GAMES,
+    DECAY_END,
+    DECAY_GAMES,
+    DECAY_START,
+    K_BASE,
+    LOG_LOSS_EPS,
+    MOV_DEFAULT,
+    MOV_MULTIPLIERS,
+    PHASE_EARLY_END,
+    PHASE_MID_END,
+    PHASE_WEIGHT_EARLY,
+    PHASE_WEIGHT_LATE,
+    PHASE_WEIGHT_MID,
+    BacktestObserver,
+    replay,
+)
+from match_data import ALL_PLAYERS, get_completed_matches, parse_tournament_csv
+
+PARAMS = (
+    "k_base",
+    "decay_start",
+    "decay_end",
+    "decay_games",
+    "phase_early",
+    "phase_mid",
+    "phase_late",
+    "mov_3_0",
+    "mov_3_1",
+    "mov_3_2",
+)
+
+# Uniform ranges for --samples
+SAMPLE_RANGES: dict[str, tuple[float, float]] = {
+    "k_base": (16.0, 48.0),
+    "decay_start": (1.0, 2.0),
+    "decay_end": (0.5, 1.0),
+    "decay_games": (10.0, 50.0),
+    "phase_early": (0.9, 1.3),
+    "phase_mid": (0.8, 1.2),
+    "phase_late": (0.7, 1.1),
+    "mov_3_0": (1.0, 1.6),
+    "mov_3_1": (0.9, 1.3),
+    "mov_3_2": (0.6, 1.0),
+}
+
+RANK_METRICS = ("log_loss", "brier", "accuracy")
+
+
+def current_params() -> dict[str, float]:
+    """The elo_engine constants as a parameter set."""
+    return {
+        "k_base": float(K_BASE),
+        "decay_start": DECAY_START,
+        "decay_end": DECAY_END,
+        "decay_games": float(DECAY_GAMES),
+        "phase_early": PHASE_WEIGHT_EARLY,
+        "phase_mid": PHASE_WEIGHT_MID,
+        "phase_late": PHASE_WEIGHT_LATE,
+        "mov_3_0": MOV_MULTIPLIERS[(3, 0)],
+        "mov_3_1": MOV_MULTIPLIERS[(3, 1)],
+        "mov_3_2": MOV_MULTIPLIERS[(3, 2)],
+    }
+
+
+def _with_current(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Prepend the current constants as configuration 0."""
+    base = current_params()
+    return {p: np.concatenate([[base[p]], columns[p]]) for p in PARAMS}
+
+
+def sample_configs(n: int, seed: int) -> dict[str, np.ndarray]:
+    """Current constants plus n parameter sets drawn uniformly from SAMPLE_RANGES."""
+    rng = np.random.default_rng(seed)
+    columns = {p: rng.uniform(*SAMPLE_RANGES[p], size=n) for p in PARAMS}
+    columns["decay_games"] = np.round(columns["decay_games"])
+    return _with_current(columns)
+
+
+def grid_configs(grid: dict[str, list[float]]) -> dict[str, np.ndarray]:
+    """Current constants plus the cartesian product of grid values.
+
+    Parameters not in the grid keep their current value.
+    """
+    base = current_params()
+    names = list(grid)
+    combos = list(itertools.product(*(grid[p] for p in names)))
+    columns = {p: np.full(len(combos), base[p]) for p in PARAMS}
+    for j, p in enumerate(names):
+        columns[p] = np.array([c[j] for c in combos], dtype=float)
+    return _with_current(columns)
+
+
+def _compile_matches(matches: list[dict]) -> list[tuple]:
+    """Per match: (p1, p2, round, outcome, mov key).
+
+    outcome: 1.0 player 1 won, 0.0 player 2 won, 0.5 draw, None skipped.
+    mov key: "mov_3_0" / "mov_3_1" / "mov_3_2", or None for MOV_DEFAULT.
+    """
+    index = {p: i for i, p in enumerate(ALL_PLAYERS)}
+    mov_keys = {(3, 0): "mov_3_0", (3, 1): "mov_3_1", (3, 2): "mov_3_2"}
+    compiled = []
+    for m in matches:
+        if m["is_draw"]:
+            outcome, mov = 0.5, None
+        elif m["winner"] is None:
+            outcome, mov = None, None
+        else:
+            outcome = 1.0 if m["winner"] == m["player1"] else 0.0
+            winner_score = m["score1"] if outcome == 1.0 else m["score2"]
+            loser_score = m["score2"] if outcome == 1.0 else m["score1"]
+            key = (winner_score, loser_score)
+            if key not in MOV_MULTIPLIERS:
+                mov = None
+            else:
+                mov = mov_keys.get(key) or mov_keys[(key[1], key[0])]
+        compiled.append((index[m["player1"]], index[m["player2"]], m["round"], outcome, mov))
+    return compiled
+
+
+def _decay(n: int, start, span, end, games) -> np.ndarray:
+    """elo_engine.games_played_decay for every configuration."""
+    return np.where(n >= games, end, start + span * (n / games))
+
+
+def replay_configs(compiled: list[tuple], configs: dict[str, np.ndarray]) -> dict:
+    """Replay every configuration in lockstep and score the predictions.
+
+    Same arithmetic as elo_engine.update_elo, one configuration per row.
+
+    Returns:
+        dict of (C,) arrays: brier, log_loss, accuracy, plus n_scored and the
+        (C, P) final elo
+    """
+    n_configs = len(configs["k_base"])
+    elo = np.full((n_configs, len(ALL_PLAYERS)), 1500.0)
+    games = np.zeros(len(ALL_PLAYERS), dtype=np.int64)  # Same for every configuration
+
+    k_base = configs["k_base"]
+    decay = (
+        configs["decay_start"],
+        configs["decay_end"] - configs["decay_start"],
+        configs["decay_end"],
+        configs["decay_games"],
+    )
+    phases = (configs["phase_early"], configs["phase_mid"], configs["phase_late"])
+
+    brier = np.zeros(n_configs)
+    log_loss = np.zeros(n_configs)
+    correct = np.zeros(n_configs)
+    n_scored = 0
+
+    for p1, p2, round_num, outcome, mov_key in compiled:
+        if outcome is None:
+            continue
+        games_before = (games[p1], games[p2])
+        games[p1] += 1
+        games[p2] += 1
+        if outcome == 0.5:
+            continue  # Draws: no Elo change
+
+        elo1 = elo[:, p1]
+        elo2 = elo[:, p2]
+        e1 = 1.0 / (1.0 + np.power(10.0, (elo2 - elo1) / 400.0))
+
+        if min(games_before) >= BACKTEST_MIN_GAMES:
+            n_scored += 1
+            brier += (e1 - outcome) ** 2
+            p = np.clip(e1 if outcome == 1.0 else 1.0 - e1, LOG_LOSS_EPS, 1.0)
+            log_loss -= np.log(p)
+            correct += (e1 >= 0.5) == (outcome == 1.0)
+
+        if round_num <= PHASE_EARLY_END:
+            phase = phases[0]
+        elif round_num <= PHASE_MID_END:
+            phase = phases[1]
+        else:
+            phase = phases[2]
+        mov = configs[mov_key] if mov_key is not None else MOV_DEFAULT
+
+        if outcome == 1.0:
+            winner, loser, n_winner, n_loser, e_winner = p1, p2, *games_before, e1
+        else:
+            winner, loser, n_loser, n_winner = p2, p1, *games_before
+            e_winner = 1.0 / (1.0 + np.power(10.0, (elo1 - elo2) / 400.0))
+        e_loser = 1.0 - e_winner
+        k_winner = k_base * _decay(n_winner, *decay) * phase
+        k_loser = k_base * _decay(n_loser, *decay) * phase
+        elo[:, winner] += k_winner * mov * (1.0 - e_winner)
+        elo[:, loser] += k_loser * mov * (0.0 - e_loser)
+
+    scored = max(n_scored, 1)
+    return {
+        "brier": brier / scored,
+        "log_loss": log_loss / scored,
+        "accuracy": correct / scored,
+        "n_scored": n_scored,
+        "elo": elo,
+    }
+
+
+def _replay_chunk(compiled: list[tuple], configs: dict[str, np.ndarray]) -> dict:
+    """Worker entry point; drops the final ratings to keep results small."""
+    metrics = replay_configs(compiled, configs)
+    del metrics["elo"]
+    return metrics
+
+
+def sweep(
+    matches: list[dict], configs: dict[str, np.ndarray], workers: int = 1, chunk_size: int = 256
+) -> list[dict]:
+    """Score every configuration, split into chunks across worker processes.
+
+    Returns:
+        One dict per configuration (parameters, brier, log_loss, accuracy,
+        current), in configuration order
+    """
+    compiled = _compile_matches(matches)
+    n_configs = len(configs["k_base"])
+    starts = range(0, n_configs, chunk_size)
+    chunks = [{p: configs[p][i : i + chunk_size] for p in PARAMS} for i in starts]
+
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_replay_chunk, [compiled] * len(chunks), chunks))
+    else:
+        parts = [_replay_chunk(compiled, chunk) for chunk in chunks]
+
+    metrics = {m: np.concatenate([part[m] for part in parts]) for m in RANK_METRICS}
+    return [
+        {
+            **{p: float(configs[p][i]) for p in PARAMS},
+            **{m: float(metrics[m][i]) for m in RANK_METRICS},
+            "current": i == 0,
+        }
+        for i in range(n_configs)
+    ]
+
+
+def rank(results: list[dict], by: str = "log_loss") -> list[dict]:
+    """Best first: lowest Brier/log loss, or highest accuracy."""
+    return sorted(results, key=lambda r: -r[by] if by == "accuracy" else r[by])
+
+
+def check_current(matches: list[dict]):
+    """Assert the vectorized replay reproduces elo_engine for the current constants."""
+    metrics = replay_configs(_compile_matches(matches), _with_current({p: [] for p in PARAMS}))
+    backtest = BacktestObserver()
+    ratings = replay(matches, [backtest])
+
+    elo_diff = max(abs(metrics["elo"][0, i] - ratings[p].elo) for i, p in enumerate(ALL_PLAYERS))
+    bt = backtest.result()
+    print(
+        f"Check vs elo_engine: max |elo diff| {elo_diff:.2e}, "
+        f"accuracy {metrics['accuracy'][0]:.4f} vs {bt['accuracy']:.4f}, "
+        f"scored {metrics['n_scored']} vs {bt['total']}"
+    )
+    assert elo_diff < 1e-9
+    assert metrics["n_scored"] == bt["total"]
+    for metric in RANK_METRICS:
+        assert abs(metrics[metric][0] - bt[metric]) < 1e-12, metric
+
+
+def _parse_grid(items: list[str]) -> dict[str, list[float]]:
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in PARAMS or not values:
+            raise SystemExit(f"--grid expects NAME=v1,v2,... with NAME one of: {', '.join(PARAMS)}")
+        grid[name] = [float(v) for v in values.split(",")]
+    return grid
+
+
+def print_ranking(results: list[dict], by: str, top: int):
+    ranked = rank(results, by)
+    header = f"{'#':>4} {'LogLoss':>8} {'Brier':>7} {'Acc%':>6}  " + " ".join(
+        f"{p:>11}" for p in PARAMS
+    )
+    print(header)
+    print("-" * len(header))
+    for i, r in enumerate(ranked, 1):
+        if i > top and not r["current"]:
+            continue
+        marker = "  <- current" if r["current"] else ""
+        print(
+            f"{i:>4} {r['log_loss']:>8.4f} {r['brier']:>7.4f} {r['accuracy'] * 100:>6.2f}  "
+            + " ".join(f"{r[p]:>11.3f}" for p in PARAMS)
+            + marker
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=500, help="Random parameter sets")
+    parser.add_argument("--grid", action="append", default=[], help="NAME=v1,v2,... (repeatable)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--rank-by", choices=RANK_METRICS, default="log_loss")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--db", action="store_true", help="Use the database, not the CSV")
+    parser.add_argument("--check", action="store_true", help="Verify against elo_engine")
+    args = parser.parse_args()
+
+    if args.db:
+        from match_data import completed_matches
+
+        matches = completed_matches()
+    else:
+        matches = get_completed_matches(parse_tournament_csv())
+
+    print("Fantasy Darts Elo Hyperparameter Sweep")
+    print("=" * 52)
+    if args.check:
+        check_current(matches)
+
+    if args.grid:
+        configs = grid_configs(_parse_grid(args.grid))
+    else:
+        configs = sample_configs(args.samples, args.seed)
+    n_configs = len(configs["k_base"])
+
+    start = time.perf_counter()
+    results = sweep(matches, configs, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Matches: {len(matches)}  configurations: {n_configs:,}  workers: {args.workers}  "
+        f"time: {elapsed:.2f}s ({n_configs / elapsed:,.0f} configs/s)\n"
+    )
+    print_ranking(results, args.rank_by, args.top)
@@ -132,14 +132,92 @@ export interface PlayerRating {
   games_played: number;
 }
 
+export interface RatingHistory {
+  data_version: number;
+  max_points: number;
+  players: { player: string; games_played: number; match_ids: number[]; elos: number[] }[];
+}
+
 export interface OutrightOdds {
   player: string;
   true_probability: number;
   implied_probability: number;
   odds: number;
   top8_pct: number;
+  iterations: number;
+  std_error: number;
+  ci_low: number;
+  ci_high: number;
+}
+
+export interface FinishingDistribution {
+  players: string[];
+  columns: string[];  // pos_1..pos_N, reach_qf, reach_sf, reach_final, title
+  iterations: number;
+  matrix: number[][];  // matrix[i][j]: probability for players[i], columns[j]
+}
+
+export interface KnockoutMatrix {
+  stage: 'QF' | 'SF' | 'Final';
+  players: string[];
+  elo: number[];
+  higher_seed: number[][];  // [i][j]: P(players[i] beats players[j]), i higher seed
+  lower_seed: number[][];  // [i][j]: same with players[i] as lower seed
+}
+
+export interface ForecastScore {
+  n: number;
+  brier: number;
+  log_loss: number;
+  accuracy: number;
 }
 
+export interface BinaryForecastScore extends ForecastScore {
+  calibration: { low: number; high: number; count: number; predicted: number; observed: number }[];
+}
+
+export interface BacktestReport {
+  data_version: number;
+  completed_matches: number;
+  elo: BinaryForecastScore;
+  knockout: BinaryForecastScore;
+  exact_score: ForecastScore;
+}
+
+export interface RatingStateCheck {
+  consistent: boolean;
+  repaired: boolean;
+  mismatches: { player: string; stored: Record<string, number | null> | null; replayed: Record<string, number | null> }[];
+}
+
+export interface WhatIfCondition {
+  match_id: number;
+  player1: string;
+  player2: string;
+  winner: string;
+}
+
+export interface WhatIfOdds {
+  player: string;
+  true_probability: number;
+  baseline_probability: number;
+  top8_pct: number;
+  std_error: number;
+}
+
+export interface WhatIfResponse {
+  conditions: WhatIfCondition[];
+  paths_total: number;
+  paths_matched: number;
+  sufficient_paths: boolean;
+  odds: WhatIfOdds[];
+}
+
+export type SimulationStreamEvent =
+  | { event: 'start'; run_id: string; max_iterations: number; report_every: number }
+  | { event: 'progress'; run_id: string; iterations: number; converged: boolean; odds: OutrightOdds[] }
+  | { event: 'done'; run_id: string; status: 'complete' | 'converged' | 'cancelled'; iterations: number };
+
 export interface EnterResultResponse {
   message: string;
   match_id: number;
@@ -147,6 +225,7 @@ export interface EnterResultResponse {
   score: string;
   updated_ratings: PlayerRating[];
   updated_outright_odds: OutrightOdds[];
+  snapshot_version: number;
 }
 
 // Prop Market types (S7)
@@ -334,8 +413,15 @@ class ApiClient {
     return this.fetch<StandingEntry[]>('/tournament/standings');
   }
 
-  async getTournamentRatings(): Promise<PlayerRating[]> {
-    return this.fetch<PlayerRating[]>('/tournament/ratings');
+  async getTournamentRatings(asOfMatch?: number): Promise<PlayerRating[]> {
+    const qs = asOfMatch !== undefined ? `?as_of_match=${asOfMatch}` : '';
+    return this.fetch<PlayerRating[]>(`/tournament/ratings${qs}`);
+  }
+
+  // Per-player Elo trajectories, downsampled server-side to maxPoints each.
+  async getRatingHistory(maxPoints?: number): Promise<RatingHistory> {
+    const qs = maxPoints !== undefined ? `?points=${maxPoints}` : '';
+    return this.fetch<RatingHistory>(`/tournament/ratings/history${qs}`);
   }
 
   async getResults(): Promise<CompletedMatch[]> {
@@ -346,6 +432,19 @@ class ApiClient {
     return this.fetch<ScheduledMatch[]>('/tournament/upcoming');
   }
 
+  async getFinishingDistribution(): Promise<FinishingDistribution> {
+    return this.fetch<FinishingDistribution>('/tournament/finishing-distribution');
+  }
+
+  async getWhatIfOdds(conditions: { matchId: number; winner: string }[]): Promise<WhatIfResponse> {
+    const params = new URLSearchParams();
+    for (const c of conditions) {
+      params.append('match_id', String(c.matchId));
+      params.append('winner', c.winner);
+    }
+    return this.fetch<WhatIfResponse>(`/tournament/what-if?${params.toString()}`);
+  }
+
   // Admin Tournament
   async getScheduledMatches(): Promise<ScheduledMatch[]> {
     return this.fetch<ScheduledMatch[]>('/admin/scheduled-matches');
@@ -369,6 +468,72 @@ class ApiClient {
     return this.fetch<OutrightOdds[]>('/admin/current-odds');
   }
 
+  async getKnockoutMatrix(stage: 'QF' | 'SF' | 'Final' = 'QF'): Promise<KnockoutMatrix> {
+    return this.fetch<KnockoutMatrix>(`/admin/knockout-matrix?stage=${stage}`);
+  }
+
+  async checkRatingState(): Promise<RatingStateCheck> {
+    return this.fetch<RatingStateCheck>('/admin/rating-state/check');
+  }
+
+  // Rebuilds the persisted Elo state from a replay if it is inconsistent.
+  async repairRatingState(): Promise<RatingStateCheck> {
+    return this.fetch<RatingStateCheck>('/admin/rating-state/repair', { method: 'POST' });
+  }
+
+  async getBacktestReport(): Promise<BacktestReport> {
+    return this.fetch<BacktestReport>('/admin/backtest');
+  }
+
+  // Streams interim outright odds (SSE) until done, converged or cancelled.
+  // Uses fetch rather than EventSource so the admin token can be sent.
+  async streamOutrightSimulation(
+    onEvent: (event: SimulationStreamEvent) => void,
+    params: { tolerance?: number; maxIterations?: number; reportEvery?: number } = {},
+    signal?: AbortSignal,
+  ): Promise<void> {
+    const qs = new URLSearchParams();
+    if (params.tolerance) qs.append('tolerance', String(params.tolerance));
+    if (params.maxIterations) qs.append('max_iterations', String(params.maxIterations));
+    if (params.reportEvery) qs.append('report_every', String(params.reportEvery));
+    const token = this.getToken();
+    const response = await fetch(`${API_BASE}/admin/simulations/stream?${qs.toString()}`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+      throw new Error(error.detail || 'API request failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const frame = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        let event = 'message';
+        let data = '';
+        for (const line of frame.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data += line.slice(6);
+        }
+        if (data) onEvent({ event, ...JSON.parse(data) } as SimulationStreamEvent);
+      }
+    }
+  }
+
+  async cancelSimulation(runId: string): Promise<{ message: string; run_id: string }> {
+    return this.fetch<{ message: string; run_id: string }>(`/admin/simulations/${runId}/cancel`, {
+      method: 'POST',
+    });
+  }
+
   // Prop Markets (S7)
   async getPropMarkets(matchId?: number, status?: string): Promise<Market[]> {
     const params = new URLSearchParams();